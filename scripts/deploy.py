@@ -2,38 +2,67 @@
 """Deployment script"""
 
 import argparse
+import shlex
 import subprocess
 
 
 def run_command(command, check=True):
-    """Run shell command"""
+    """Run command without an intermediate shell"""
     print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, check=check)
+    try:
+        result = subprocess.run(shlex.split(command), check=check)
+    except FileNotFoundError:
+        print(f"Command not found: {command.split()[0]}")
+        return False
     return result.returncode == 0
 
+def run_commands_concurrently(commands):
+    """Run independent commands in parallel and wait for all of them"""
+    processes = {}
+    for command in commands:
+        print(f"Running: {command}")
+        try:
+            processes[command] = subprocess.Popen(shlex.split(command))
+        except FileNotFoundError:
+            print(f"Command not found: {command.split()[0]}")
+            processes[command] = None
+
+    return {
+        command: process is not None and process.wait() == 0
+        for command, process in processes.items()
+    }
+
 def deploy_local():
     """Deploy locally with Docker Compose"""
-    commands = [
+    # Pulling the backing service images doesn't depend on the API build
+    prepare_commands = [
         "docker-compose build",
+        "docker-compose pull postgres redis",
+    ]
+    commands = [
         "docker-compose up -d",
         "sleep 10",
-        "curl -f http://localhost:8000/health || echo 'Health check failed'"
     ]
+    health_check = "curl -f http://localhost:8000/health"
+
+    for cmd, succeeded in run_commands_concurrently(prepare_commands).items():
+        if not succeeded:
+            print(f"Warning: {cmd} may have failed")
 
     for cmd in commands:
         if not run_command(cmd, check=False):
             print(f"Warning: {cmd} may have failed")
 
+    if not run_command(health_check, check=False):
+        print("Health check failed")
+
 def run_tests():
     """Run test suite"""
-    commands = [
-        "uv run python -m pytest tests/ -v --tb=short",
-        "uv run python -m pytest tests/ --cov=src --cov-report=html"
-    ]
+    # One run collects coverage too, instead of executing the suite twice
+    cmd = "uv run python -m pytest tests/ -v --tb=short --cov=src --cov-report=html"
 
-    for cmd in commands:
-        if not run_command(cmd, check=False):
-            print(f"Warning: {cmd} failed")
+    if not run_command(cmd, check=False):
+        print(f"Warning: {cmd} failed")
 
 def main():
     parser = argparse.ArgumentParser(description="Deploy Due Diligence System")
@@ -2,14 +2,19 @@
 """Setup script for development environment"""
 
 import os
+import shlex
 import subprocess
 import sys
 
 
 def run_command(command, check=True):
-    """Run shell command"""
+    """Run command without an intermediate shell"""
     print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, check=check)
+    try:
+        result = subprocess.run(shlex.split(command), check=check)
+    except FileNotFoundError:
+        print(f"Command not found: {command.split()[0]}")
+        return False
     return result.returncode == 0
 
 def setup_database():
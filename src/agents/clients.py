@@ -0,0 +1,81 @@
+import os
+from functools import lru_cache
+
+import httpx
+import structlog
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_openai import ChatOpenAI
+
+from src.config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_http_async_client() -> httpx.AsyncClient:
+    """Return the process-wide async HTTP client shared by all model clients"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=settings.llm_timeout
+    )
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> InMemoryRateLimiter | None:
+    """Return the shared limiter that spaces OpenAI requests under OPENAI_RPM
+
+    Requests wait for a token up front instead of bursting into 429s and
+    retrying with backoff. Setting OPENAI_RPM to 0 disables throttling.
+    """
+    if not settings.openai_rpm:
+        return None
+    return InMemoryRateLimiter(
+        requests_per_second=settings.openai_rpm / 60,
+        check_every_n_seconds=0.05,
+        max_bucket_size=max(1, settings.openai_rpm // 60)
+    )
+
+
+@lru_cache(maxsize=8)
+def get_chat_model(model_name: str, temperature: float, json_mode: bool = False) -> ChatOpenAI:
+    """Return a shared ChatOpenAI client so agents reuse one connection pool"""
+    model_kwargs = {"response_format": {"type": "json_object"}} if json_mode else {}
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=settings.openai_api_key,
+        model_kwargs=model_kwargs,
+        http_async_client=get_http_async_client(),
+        rate_limiter=get_rate_limiter()
+    )
+
+
+async def warmup_clients():
+    """Open the OpenAI connection ahead of the first model call
+
+    Lists models, which costs nothing, so DNS and the TLS handshake are paid
+    at startup instead of by the first task. Failures are logged and ignored.
+    """
+    if not settings.has_openai_key:
+        return
+    base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    try:
+        await get_http_async_client().get(
+            f"{base_url}/models",
+            headers={"Authorization": f"Bearer {settings.openai_api_key}"}
+        )
+    except httpx.HTTPError as e:
+        logger.warning("client_warmup_failed", error=str(e))
+
+
+async def aclose_clients():
+    """Close the shared HTTP client at process shutdown
+
+    Compiled agent graphs cached by the task agents keep references to their
+    model clients, so this is not a way to recycle connections mid-process.
+    """
+    if get_http_async_client.cache_info().currsize:
+        await get_http_async_client().aclose()
+    get_http_async_client.cache_clear()
+    get_rate_limiter.cache_clear()
+    get_chat_model.cache_clear()
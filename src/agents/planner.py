@@ -1,9 +1,11 @@
-import json
+import asyncio
 from typing import Any
 
-from langchain_openai import ChatOpenAI
+import orjson
 
+from src.agents.clients import get_chat_model
 from src.config.settings import settings
+from src.memory.cache import ResponseCache, prompt_key
 from src.state.definitions import (
     DueDiligenceState,
     EntityType,
@@ -11,27 +13,27 @@ from src.state.definitions import (
     TaskStatus,
 )
 
+# Parsed planner responses shared across agent instances, keyed on prompt hash
+_response_cache = ResponseCache(maxsize=256)
+
 
 class PlanningAgent:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.default_model
-        self.model = ChatOpenAI(
-            model=self.model_name,
-            temperature=settings.default_temperature,
-            api_key=settings.openai_api_key
+        # JSON mode guarantees syntactically valid JSON from every planner prompt
+        self.model = get_chat_model(
+            self.model_name, settings.default_temperature, json_mode=True
         )
 
-    async def plan(self, state: DueDiligenceState) -> dict[str, Any]:
+    async def plan(self, state: DueDiligenceState, force: bool = False) -> dict[str, Any]:
         """Decompose query into parallel research tasks"""
 
-        # Analyze query complexity
-        query_analysis = await self._analyze_query(state["query"])
-
-        # Generate research plan
-        plan = await self._generate_plan(
+        # Analyze query complexity and generate the research plan in one call
+        query_analysis, plan = await self._analyze_and_plan(
             query=state["query"],
             entity_type=state["entity_type"],
-            entity_name=state["entity_name"]
+            entity_name=state["entity_name"],
+            force=force
         )
 
         # Create task specifications
@@ -47,7 +49,35 @@ class PlanningAgent:
             }
         }
 
-    async def _analyze_query(self, query: str) -> dict[str, Any]:
+    async def _invoke_json(
+        self, prompt: str, force: bool = False, required_keys: tuple[str, ...] = ()
+    ) -> dict[str, Any] | None:
+        """Invoke the model and parse a JSON response, reusing cached responses"""
+        key = prompt_key(self.model_name, prompt)
+        if not force:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await asyncio.wait_for(
+                self.model.ainvoke(prompt), timeout=settings.llm_timeout
+            )
+        except asyncio.TimeoutError:
+            # A stalled call falls back to defaults instead of blocking planning
+            return None
+
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
+
+        # Only complete responses are cached so fallbacks get retried next time
+        if isinstance(result, dict) and all(k in result for k in required_keys):
+            _response_cache.set(key, result)
+        return result
+
+    async def _analyze_query(self, query: str, force: bool = False) -> dict[str, Any]:
         """Analyze query complexity and requirements"""
 
         prompt = f"""
@@ -60,78 +90,95 @@ class PlanningAgent:
         - risk_level: "low", "medium", or "high"
         """
 
-        response = await self.model.ainvoke(prompt)
-
-        try:
-            return json.loads(response.content)
-        except json.JSONDecodeError:
-            # Fallback default
-            return {
-                "complexity": "moderate",
-                "estimated_time": 15,
-                "key_areas": ["background", "compliance"],
-                "risk_level": "medium"
-            }
+        analysis = await self._invoke_json(prompt, force=force)
+        return analysis if isinstance(analysis, dict) else self._default_analysis()
 
-    async def _generate_plan(self, query: str, entity_type: EntityType, entity_name: str) -> dict[str, Any]:
-        """Generate comprehensive research plan"""
+    async def _analyze_and_plan(
+        self, query: str, entity_type: EntityType, entity_name: str, force: bool = False
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Analyze the query and generate a research plan with a single model call"""
 
         prompt = f"""
-        Create a comprehensive due diligence research plan for:
+        Analyze and create a comprehensive due diligence research plan for:
         Entity: {entity_name}
         Type: {entity_type}
         Query: {query}
 
-        Return a JSON plan with:
+        Return a single JSON object with two keys:
         {{
-            "strategy": "Overall research strategy description",
-            "tasks": [
-                {{
-                    "description": "Task description",
-                    "priority": 1-10,
-                    "agent": "research|financial|legal|osint|verification",
-                    "output_schema": {{"expected_fields": ["field1", "field2"]}}
-                }}
-            ],
-            "required_agents": ["list", "of", "agents"],
-            "dependencies": {{"task_id": ["dependent_task_ids"]}}
+            "analysis": {{
+                "complexity": "simple|moderate|complex",
+                "estimated_time": "estimated completion time in minutes",
+                "key_areas": ["list", "of", "research", "areas"],
+                "risk_level": "low|medium|high"
+            }},
+            "plan": {{
+                "strategy": "Overall research strategy description",
+                "tasks": [
+                    {{
+                        "description": "Task description",
+                        "priority": 1-10,
+                        "agent": "research|financial|legal|osint|verification",
+                        "output_schema": {{"expected_fields": ["field1", "field2"]}}
+                    }}
+                ],
+                "required_agents": ["list", "of", "agents"],
+                "dependencies": {{"task_id": ["dependent_task_ids"]}}
+            }}
         }}
 
         Focus on creating 3-5 parallel tasks that don't depend on each other.
         """
 
-        response = await self.model.ainvoke(prompt)
+        result = await self._invoke_json(
+            prompt, force=force, required_keys=("analysis", "plan")
+        )
+        if not isinstance(result, dict):
+            result = {}
+
+        # Fall back per section so one malformed half doesn't discard the other
+        analysis = result.get("analysis")
+        plan = result.get("plan")
+        if not isinstance(analysis, dict):
+            analysis = self._default_analysis()
+        if not isinstance(plan, dict):
+            plan = self._default_plan(entity_name)
+        return analysis, plan
+
+    def _default_analysis(self) -> dict[str, Any]:
+        """Fallback query analysis when the model response is unusable"""
+        return {
+            "complexity": "moderate",
+            "estimated_time": 15,
+            "key_areas": ["background", "compliance"],
+            "risk_level": "medium"
+        }
 
-        try:
-            return json.loads(response.content)
-        except json.JSONDecodeError:
-            # Fallback plan
-            return {
-                "strategy": f"Comprehensive due diligence research on {entity_name}",
-                "tasks": [
-                    {
-                        "description": f"Background research on {entity_name}",
-                        "priority": 5,
-                        "agent": "research",
-                        "output_schema": {"background": "str", "key_facts": "list"}
-                    }
-                ],
-                "required_agents": ["research"],
-                "dependencies": {}
-            }
+    def _default_plan(self, entity_name: str) -> dict[str, Any]:
+        """Fallback research plan when the model response is unusable"""
+        return {
+            "strategy": f"Comprehensive due diligence research on {entity_name}",
+            "tasks": [
+                {
+                    "description": f"Background research on {entity_name}",
+                    "priority": 5,
+                    "agent": "research",
+                    "output_schema": {"background": "str", "key_facts": "list"}
+                }
+            ],
+            "required_agents": ["research"],
+            "dependencies": {}
+        }
 
     def _create_tasks(self, plan: dict, analysis: dict) -> list[ResearchTask]:
         """Create parallel task specifications"""
-        tasks = []
-
-        for _idx, task_spec in enumerate(plan.get("tasks", [])):
-            task = ResearchTask(
+        return [
+            ResearchTask(
                 description=task_spec["description"],
                 priority=task_spec.get("priority", 5),
                 status=TaskStatus.PENDING,
                 assigned_agent=task_spec["agent"],
                 output_schema=task_spec.get("output_schema", {})
             )
-            tasks.append(task)
-
-        return tasks
+            for task_spec in plan.get("tasks", [])
+        ]
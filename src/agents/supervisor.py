@@ -1,10 +1,10 @@
 from typing import Annotated
 
 from langchain_core.tools import InjectedToolCallId, tool
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import InjectedState, create_react_agent
 from langgraph.types import Command
 
+from src.agents.clients import get_chat_model
 from src.config.settings import settings
 from src.state.definitions import DueDiligenceState
 
@@ -27,80 +27,61 @@ def create_handoff_tool(*, agent_name: str, description: str = None):
             "metadata": {"delegated_by": "supervisor"}
         }
 
-        # Update state with new task
-        updated_state = {
-            **state,
-            "messages": state["messages"] + [task_message]
-        }
-
+        # Send only the new message; the add_messages reducer appends it to state
         return Command(
             goto=agent_name,
-            update=updated_state,
+            update={"messages": [task_message]},
             graph=Command.PARENT,
         )
 
     return handoff_tool
 
+# Kept as a static constant so the prompt prefix is byte-identical across
+# requests and provider-side prompt caching can hit. Pass per-request data
+# (entity names, dates) in messages, never by formatting this string.
+_SUPERVISOR_PROMPT = """You are the supervisor of a multi-agent due diligence system.
+
+Your responsibilities:
+1. Analyze incoming queries to determine entity type and research scope
+2. Delegate to the planning agent for complex multi-step research
+3. Route specific tasks to specialized agents
+4. Ensure all research is thorough and verified
+5. Coordinate synthesis of findings into comprehensive reports
+
+Always start with the planning agent for complex queries.
+Ensure verification agent validates critical findings.
+End with synthesis agent for report generation.
+
+Be concise and direct in your delegations.
+"""
+
+# Static (agent name, description) pairs for supervisor delegation
+_HANDOFF_SPECS = (
+    ("planner", "Delegate to planning agent for task decomposition"),
+    ("research", "Delegate to research agent for web research"),
+    ("financial", "Delegate to financial agent for financial analysis"),
+    ("legal", "Delegate to legal agent for compliance research"),
+    ("osint", "Delegate to OSINT agent for digital footprint analysis"),
+    ("verification", "Delegate to verification agent for fact-checking"),
+    ("synthesis", "Delegate to synthesis agent for report generation"),
+)
+
+# Handoff tools are stateless, so they are built once at import
+_HANDOFF_TOOLS = tuple(
+    create_handoff_tool(agent_name=name, description=description)
+    for name, description in _HANDOFF_SPECS
+)
+
 class SupervisorAgent:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.default_model
-        self.model = ChatOpenAI(
-            model=self.model_name,
-            temperature=settings.default_temperature,
-            api_key=settings.openai_api_key
-        )
-        self.handoff_tools = self._create_handoff_tools()
-
-    def _create_handoff_tools(self):
-        return [
-            create_handoff_tool(
-                agent_name="planner",
-                description="Delegate to planning agent for task decomposition"
-            ),
-            create_handoff_tool(
-                agent_name="research",
-                description="Delegate to research agent for web research"
-            ),
-            create_handoff_tool(
-                agent_name="financial",
-                description="Delegate to financial agent for financial analysis"
-            ),
-            create_handoff_tool(
-                agent_name="legal",
-                description="Delegate to legal agent for compliance research"
-            ),
-            create_handoff_tool(
-                agent_name="osint",
-                description="Delegate to OSINT agent for digital footprint analysis"
-            ),
-            create_handoff_tool(
-                agent_name="verification",
-                description="Delegate to verification agent for fact-checking"
-            ),
-            create_handoff_tool(
-                agent_name="synthesis",
-                description="Delegate to synthesis agent for report generation"
-            ),
-        ]
+        self.model = get_chat_model(self.model_name, settings.default_temperature)
+        self.handoff_tools = list(_HANDOFF_TOOLS)
 
     def create_agent(self):
         return create_react_agent(
             model=self.model,
             tools=self.handoff_tools,
-            prompt="""You are the supervisor of a multi-agent due diligence system.
-
-            Your responsibilities:
-            1. Analyze incoming queries to determine entity type and research scope
-            2. Delegate to the planning agent for complex multi-step research
-            3. Route specific tasks to specialized agents
-            4. Ensure all research is thorough and verified
-            5. Coordinate synthesis of findings into comprehensive reports
-
-            Always start with the planning agent for complex queries.
-            Ensure verification agent validates critical findings.
-            End with synthesis agent for report generation.
-
-            Be concise and direct in your delegations.
-            """,
+            prompt=_SUPERVISOR_PROMPT,
             name="supervisor"
         )
@@ -1,156 +1,229 @@
+import asyncio
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from typing import Any
 
-from langchain_community.tools.tavily_search import TavilySearchResults
-from langchain_core.tools import tool
-from langchain_exa import ExaFindSimilarResults, ExaSearchResults
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import create_react_agent
-
+from src.agents.clients import get_chat_model
 from src.config.settings import settings
-from src.state.definitions import ResearchTask
+from src.state.definitions import ResearchTask, TaskResult
+
+# Keyword groups for each financial focus area. The lookahead keeps matches
+# zero-width so overlapping keywords are all found, like plain substring checks.
+_FOCUS_RE = re.compile(
+    r"(?=(?P<financial_statements>financial statements|income statement)"
+    r"|(?P<market_performance>market|stock)"
+    r"|(?P<credit_analysis>credit|debt)"
+    r"|(?P<valuation>valuation|value)"
+    r"|(?P<compliance>compliance|sec))",
+    re.IGNORECASE,
+)
+
+# Whitespace-delimited token followed by a corporate suffix token, e.g. "Tesla Inc"
+_ENTITY_RE = re.compile(r"(?<!\S)(\S+)\s+(corp|inc|llc|ltd|company)(?!\S)", re.IGNORECASE)
+
+
+# Focus area -> (financial_data key, fetcher method) used to fan out data gathering
+_FETCHERS_BY_AREA = {
+    "financial_statements": ("sec_filings", "_fetch_sec_filings"),
+    "market_performance": ("market_data", "_fetch_market_data"),
+    "credit_analysis": ("credit_info", "_fetch_credit_info"),
+}
+
+# Rating labels shared by the financial analysis results
+_GOOD = "Good"
+_CONCERNING = "Concerning"
+_MODERATE = "Moderate"
+_REASONABLE = "Reasonable"
+_HIGH = "High"
+_LARGE_CAP = "Large Cap"
+_SMALL_MID_CAP = "Small/Mid Cap"
+
+# Rating bands: labels[i] covers values between thresholds[i-1] and thresholds[i].
+# Liquidity is rated Good only strictly above 1.5, so it is looked up with
+# bisect_left; leverage and valuation flip to High at their threshold (bisect_right).
+_LIQUIDITY_THRESHOLDS = (1.5,)
+_LIQUIDITY_LABELS = (_CONCERNING, _GOOD)
+_LEVERAGE_THRESHOLDS = (0.5,)
+_LEVERAGE_LABELS = (_MODERATE, _HIGH)
+_VALUATION_THRESHOLDS = (25,)
+_VALUATION_LABELS = (_REASONABLE, _HIGH)
+
+# Completeness score for each presence combination of sec_filings (bit 2),
+# market_data (bit 1) and credit_info (bit 0)
+_COMPLETENESS_SCORES = tuple(
+    0.3 * bool(mask & 0b100) + 0.25 * bool(mask & 0b010) + 0.25 * bool(mask & 0b001)
+    for mask in range(8)
+)
+
+# Static system prompt so the provider prompt cache can reuse it across
+# tasks; per-task details belong in the messages, not in this string.
+_FINANCIAL_PROMPT = """You are a financial analysis specialist focused on comprehensive financial due diligence.
+
+AVAILABLE TOOLS:
+- exa_sec_filings_neural: Deep SEC filings search with full content extraction
+- exa_financial_comprehensive: Large-scale financial research (40+ results) with full content
+- exa_earnings_reports: Earnings calls and quarterly reports with full analysis
+- exa_financial_keyword: Precise search for specific financial metrics and ratios
+- exa_find_similar_financial: Cross-verification through similar financial documents
+- tavily_urgent_market_updates: ONLY for urgent market news (use minimally)
+
+FINANCIAL ANALYSIS STRATEGY (EXA-DOMINATED):
+1. Start with exa_financial_comprehensive for broad financial landscape analysis
+2. Use exa_sec_filings_neural for deep dive into official SEC documents with full content
+3. Use exa_earnings_reports for detailed earnings analysis and management commentary
+4. Use exa_financial_keyword for specific metrics, ratios, or technical financial terms
+5. Use exa_find_similar_financial to expand analysis through similar company comparisons
+6. ONLY use tavily_urgent_market_updates for breaking market news (last resort)
+7. Always leverage full content extraction and highlights for comprehensive financial analysis
+
+PARALLEL TOOL CALLS:
+The search tools are independent, read-only lookups. When several are needed for the
+same entity, request them together in a single step instead of one per turn.
+Example: for "Assess Acme Corp's latest results", call exa_sec_filings_neural
+("Acme Corp 10-K 10-Q") and exa_earnings_reports ("Acme Corp earnings call") in the
+same step, then analyze both results together.
+
+KEY FOCUS AREAS:
+- Financial Statements: Revenue, profit margins, cash flow, debt levels
+- SEC Filings: Material agreements, risk factors, management discussion
+- Market Performance: Stock performance, valuation metrics, analyst ratings
+- Financial Health: Liquidity ratios, debt-to-equity, working capital
+- Red Flags: Audit issues, restatements, regulatory actions, covenant violations
+
+QUALITY STANDARDS:
+- Prioritize official SEC filings over secondary sources
+- Extract specific financial metrics and ratios when available
+- Note filing dates and ensure data recency
+- Cross-verify key financial data from multiple sources
+- Flag any inconsistencies or concerning trends
+"""
+
+
+@lru_cache(maxsize=1)
+def _build_financial_tools() -> tuple:
+    """Build the financial tool suite once per process"""
+    exa_key = settings.exa_api_key
+    tavily_key = settings.tavily_api_key
+    tools = []
+
+    # Add comprehensive Exa tools for financial analysis
+    if settings.has_exa_key:
+        try:
+            from langchain_exa import ExaFindSimilarResults, ExaSearchResults
+
+            # SEC filings neural search with full content
+            tools.append(ExaSearchResults(
+                name="exa_sec_filings_neural",
+                description="Deep neural search for SEC filings with full content extraction. Best for comprehensive financial document analysis.",
+                num_results=20,
+                api_key=exa_key,
+                include_domains=["sec.gov", "investor.gov", "edgar.sec.gov"],
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Financial data comprehensive search
+            tools.append(ExaSearchResults(
+                name="exa_financial_comprehensive",
+                description="Large-scale financial research with full content from authoritative sources. For thorough financial due diligence.",
+                num_results=40,
+                api_key=exa_key,
+                include_domains=["sec.gov", "finance.yahoo.com", "bloomberg.com", "marketwatch.com", "morningstar.com", "fool.com", "seekingalpha.com"],
+                type="auto",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Earnings and quarterly reports search
+            tools.append(ExaSearchResults(
+                name="exa_earnings_reports",
+                description="Search for earnings calls, quarterly reports, and earnings analysis with full content",
+                num_results=15,
+                api_key=exa_key,
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Financial keyword search for specific metrics/ratios
+            tools.append(ExaSearchResults(
+                name="exa_financial_keyword",
+                description="Precise keyword search for specific financial metrics, ratios, or technical terms",
+                num_results=12,
+                api_key=exa_key,
+                type="keyword",
+                text_contents_options=True
+            ))
+
+            # Find similar financial documents for verification
+            tools.append(ExaFindSimilarResults(
+                name="exa_find_similar_financial",
+                description="Find similar financial documents for cross-verification and expanded analysis",
+                num_results=10,
+                api_key=exa_key,
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            print("✅ Advanced Exa financial tool suite initialized successfully")
+        except Exception as e:
+            print(f"Warning: Failed to initialize Exa financial tools: {e}")
+
+    # Add minimal Tavily for immediate market updates only
+    if settings.has_tavily_key:
+        try:
+            from langchain_community.tools.tavily_search import TavilySearchResults
+
+            tools.append(TavilySearchResults(
+                name="tavily_urgent_market_updates",
+                description="ONLY for urgent market news and immediate financial updates within hours. Use minimally - Exa is primary source.",
+                max_results=3,
+                api_wrapper_kwargs={"api_key": tavily_key}
+            ))
+            print("✅ Tavily auxiliary market tool initialized")
+        except Exception as e:
+            print(f"Warning: Failed to initialize Tavily market tool: {e}")
+
+    # Add fallback tools if no APIs available
+    if not tools:
+        from langchain_core.tools import tool
+
+        @tool
+        def dummy_financial_search(query: str, entity_name: str = "") -> str:
+            """Dummy financial search tool for development/testing"""
+            return f"Mock financial search results for: {query} | Entity: {entity_name}"
+
+        tools.append(dummy_financial_search)
+        print("⚠️ Using dummy financial tools - configure API keys for real functionality")
+
+    return tuple(tools)
+
+
+@lru_cache(maxsize=8)
+def _build_financial_agent(model_name: str):
+    """Build the financial ReAct graph once per model; compiled graphs are stateless"""
+    from langgraph.prebuilt import create_react_agent
+
+    return create_react_agent(
+        model=get_chat_model(model_name, settings.default_temperature),
+        tools=list(_build_financial_tools()),
+        prompt=_FINANCIAL_PROMPT,
+        name="financial_agent"
+    )
 
 
 class FinancialAgent:
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str | None = None):
         self.model_name = model_name or settings.default_model
-        self.model = ChatOpenAI(
-            model=self.model_name,
-            temperature=settings.default_temperature,
-            api_key=settings.openai_api_key
-        )
-        self.tools = self._initialize_tools()
-
-    def _initialize_tools(self):
-        tools = []
-
-        # Add comprehensive Exa tools for financial analysis
-        if settings.has_exa_key:
-            try:
-                # SEC filings neural search with full content
-                tools.append(ExaSearchResults(
-                    name="exa_sec_filings_neural",
-                    description="Deep neural search for SEC filings with full content extraction. Best for comprehensive financial document analysis.",
-                    num_results=20,
-                    api_key=settings.exa_api_key,
-                    include_domains=["sec.gov", "investor.gov", "edgar.sec.gov"],
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Financial data comprehensive search
-                tools.append(ExaSearchResults(
-                    name="exa_financial_comprehensive",
-                    description="Large-scale financial research with full content from authoritative sources. For thorough financial due diligence.",
-                    num_results=40,
-                    api_key=settings.exa_api_key,
-                    include_domains=["sec.gov", "finance.yahoo.com", "bloomberg.com", "marketwatch.com", "morningstar.com", "fool.com", "seekingalpha.com"],
-                    type="auto",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Earnings and quarterly reports search
-                tools.append(ExaSearchResults(
-                    name="exa_earnings_reports",
-                    description="Search for earnings calls, quarterly reports, and earnings analysis with full content",
-                    num_results=15,
-                    api_key=settings.exa_api_key,
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Financial keyword search for specific metrics/ratios
-                tools.append(ExaSearchResults(
-                    name="exa_financial_keyword",
-                    description="Precise keyword search for specific financial metrics, ratios, or technical terms",
-                    num_results=12,
-                    api_key=settings.exa_api_key,
-                    type="keyword",
-                    text_contents_options=True
-                ))
-
-                # Find similar financial documents for verification
-                tools.append(ExaFindSimilarResults(
-                    name="exa_find_similar_financial",
-                    description="Find similar financial documents for cross-verification and expanded analysis",
-                    num_results=10,
-                    api_key=settings.exa_api_key,
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                print("✅ Advanced Exa financial tool suite initialized successfully")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Exa financial tools: {e}")
-
-        # Add minimal Tavily for immediate market updates only
-        if settings.has_tavily_key:
-            try:
-                tools.append(TavilySearchResults(
-                    name="tavily_urgent_market_updates",
-                    description="ONLY for urgent market news and immediate financial updates within hours. Use minimally - Exa is primary source.",
-                    max_results=3,
-                    api_wrapper_kwargs={"api_key": settings.tavily_api_key}
-                ))
-                print("✅ Tavily auxiliary market tool initialized")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Tavily market tool: {e}")
-
-        # Add fallback tools if no APIs available
-        if not tools:
-            @tool
-            def dummy_financial_search(query: str, entity_name: str = "") -> str:
-                """Dummy financial search tool for development/testing"""
-                return f"Mock financial search results for: {query} | Entity: {entity_name}"
-
-            tools.append(dummy_financial_search)
-            print("⚠️ Using dummy financial tools - configure API keys for real functionality")
-
-        return tools
+        self.model = get_chat_model(self.model_name, settings.default_temperature)
+        self.tools = list(_build_financial_tools())
 
     def create_agent(self):
-        return create_react_agent(
-            model=self.model,
-            tools=self.tools,
-            prompt="""You are a financial analysis specialist focused on comprehensive financial due diligence.
-
-            AVAILABLE TOOLS:
-            - exa_sec_filings_neural: Deep SEC filings search with full content extraction
-            - exa_financial_comprehensive: Large-scale financial research (40+ results) with full content
-            - exa_earnings_reports: Earnings calls and quarterly reports with full analysis
-            - exa_financial_keyword: Precise search for specific financial metrics and ratios
-            - exa_find_similar_financial: Cross-verification through similar financial documents
-            - tavily_urgent_market_updates: ONLY for urgent market news (use minimally)
-
-            FINANCIAL ANALYSIS STRATEGY (EXA-DOMINATED):
-            1. Start with exa_financial_comprehensive for broad financial landscape analysis
-            2. Use exa_sec_filings_neural for deep dive into official SEC documents with full content
-            3. Use exa_earnings_reports for detailed earnings analysis and management commentary
-            4. Use exa_financial_keyword for specific metrics, ratios, or technical financial terms
-            5. Use exa_find_similar_financial to expand analysis through similar company comparisons
-            6. ONLY use tavily_urgent_market_updates for breaking market news (last resort)
-            7. Always leverage full content extraction and highlights for comprehensive financial analysis
-
-            KEY FOCUS AREAS:
-            - Financial Statements: Revenue, profit margins, cash flow, debt levels
-            - SEC Filings: Material agreements, risk factors, management discussion
-            - Market Performance: Stock performance, valuation metrics, analyst ratings
-            - Financial Health: Liquidity ratios, debt-to-equity, working capital
-            - Red Flags: Audit issues, restatements, regulatory actions, covenant violations
-
-            QUALITY STANDARDS:
-            - Prioritize official SEC filings over secondary sources
-            - Extract specific financial metrics and ratios when available
-            - Note filing dates and ensure data recency
-            - Cross-verify key financial data from multiple sources
-            - Flag any inconsistencies or concerning trends
-            """,
-            name="financial_agent"
-        )
+        return _build_financial_agent(self.model_name)
 
-    async def execute_task(self, task: ResearchTask, context: str = "") -> dict[str, Any]:
+    async def execute_task(self, task: ResearchTask, context: str = "") -> TaskResult:
         """Execute financial analysis task with structured approach"""
 
         # Step 1: Extract financial analysis requirements
@@ -178,34 +251,27 @@ class FinancialAgent:
 
     def _extract_financial_focus(self, description: str, context: str) -> dict[str, Any]:
         """Extract what type of financial analysis is needed"""
-        # Determine focus areas based on task description
-        focus_areas = {
-            "financial_statements": "financial statements" in description.lower() or "income statement" in description.lower(),
-            "market_performance": "market" in description.lower() or "stock" in description.lower(),
-            "credit_analysis": "credit" in description.lower() or "debt" in description.lower(),
-            "valuation": "valuation" in description.lower() or "value" in description.lower(),
-            "compliance": "compliance" in description.lower() or "sec" in description.lower()
-        }
+        # Determine focus areas based on task description in a single regex pass
+        hits = {match.lastgroup for match in _FOCUS_RE.finditer(description)}
 
         return {
             "entity_name": self._extract_entity_name(description, context),
-            "focus_areas": [area for area, needed in focus_areas.items() if needed],
-            "analysis_type": "comprehensive" if len([a for a in focus_areas.values() if a]) > 2 else "focused"
+            # Keep the canonical focus-area order rather than set iteration order
+            "focus_areas": [area for area in _FOCUS_RE.groupindex if area in hits],
+            "analysis_type": "comprehensive" if len(hits) > 2 else "focused"
         }
 
     def _extract_entity_name(self, description: str, context: str) -> str:
         """Extract entity name from description or context"""
         # Simple extraction - in real implementation would use NLP
-        words = description.split()
-        for i, word in enumerate(words):
-            if word.lower() in ["corp", "inc", "llc", "ltd", "company"]:
-                if i > 0:
-                    return f"{words[i-1]} {word}"
+        match = _ENTITY_RE.search(description) or _ENTITY_RE.search(context)
+        if match:
+            return f"{match.group(1)} {match.group(2)}"
         return "Unknown Entity"
 
     async def _gather_financial_data(self, financial_focus: dict[str, Any]) -> dict[str, Any]:
         """Gather financial data from multiple sources"""
-        financial_focus["entity_name"]
+        entity_name = financial_focus["entity_name"]
         focus_areas = financial_focus["focus_areas"]
 
         financial_data = {
@@ -213,33 +279,27 @@ class FinancialAgent:
             "market_data": {},
             "credit_info": {},
             "financial_statements": {},
-            "sources": []
+            "sources": [],
+            "errors": []
         }
 
-        # Gather data based on focus areas
-        if "financial_statements" in focus_areas:
-            # Mock SEC filings data
-            financial_data["sec_filings"] = [
-                {"type": "10-K", "date": "2024-03-15", "summary": "Annual report"},
-                {"type": "10-Q", "date": "2024-06-15", "summary": "Quarterly report"}
-            ]
-
-        if "market_performance" in focus_areas:
-            # Mock market data
-            financial_data["market_data"] = {
-                "stock_price": 150.25,
-                "market_cap": "50.2B",
-                "pe_ratio": 18.5,
-                "revenue_ttm": "12.5B"
-            }
+        # Fetch the data sets needed for the focus areas concurrently
+        fetches = {
+            data_key: getattr(self, fetcher)(entity_name)
+            for area, (data_key, fetcher) in _FETCHERS_BY_AREA.items()
+            if area in focus_areas
+        }
 
-        if "credit_analysis" in focus_areas:
-            # Mock credit information
-            financial_data["credit_info"] = {
-                "credit_rating": "A-",
-                "debt_to_equity": 0.45,
-                "current_ratio": 1.8
-            }
+        results = await asyncio.gather(
+            *(asyncio.wait_for(fetch, timeout=settings.tool_timeout) for fetch in fetches.values()),
+            return_exceptions=True
+        )
+        for key, result in zip(fetches, results):
+            if isinstance(result, BaseException):
+                # A failed or slow source keeps its empty default instead of aborting the task
+                financial_data["errors"].append(f"{key}: {type(result).__name__}")
+            else:
+                financial_data[key] = result
 
         financial_data["sources"].extend([
             "SEC EDGAR Database",
@@ -249,6 +309,33 @@ class FinancialAgent:
 
         return financial_data
 
+    async def _fetch_sec_filings(self, entity_name: str) -> list[dict[str, Any]]:
+        """Fetch recent SEC filings for the entity"""
+        # Mock SEC filings data
+        return [
+            {"type": "10-K", "date": "2024-03-15", "summary": "Annual report"},
+            {"type": "10-Q", "date": "2024-06-15", "summary": "Quarterly report"}
+        ]
+
+    async def _fetch_market_data(self, entity_name: str) -> dict[str, Any]:
+        """Fetch market data for the entity"""
+        # Mock market data
+        return {
+            "stock_price": 150.25,
+            "market_cap": "50.2B",
+            "pe_ratio": 18.5,
+            "revenue_ttm": "12.5B"
+        }
+
+    async def _fetch_credit_info(self, entity_name: str) -> dict[str, Any]:
+        """Fetch credit information for the entity"""
+        # Mock credit information
+        return {
+            "credit_rating": "A-",
+            "debt_to_equity": 0.45,
+            "current_ratio": 1.8
+        }
+
     async def _perform_financial_analysis(self, financial_data: dict, financial_focus: dict) -> dict[str, Any]:
         """Perform comprehensive financial analysis"""
         analysis = {
@@ -265,8 +352,8 @@ class FinancialAgent:
             credit_info = financial_data["credit_info"]
             analysis["financial_health"] = {
                 "credit_rating": credit_info.get("credit_rating", "Not Available"),
-                "liquidity": "Good" if credit_info.get("current_ratio", 0) > 1.5 else "Concerning",
-                "leverage": "Moderate" if credit_info.get("debt_to_equity", 0) < 0.5 else "High"
+                "liquidity": _LIQUIDITY_LABELS[bisect_left(_LIQUIDITY_THRESHOLDS, credit_info.get("current_ratio", 0))],
+                "leverage": _LEVERAGE_LABELS[bisect_right(_LEVERAGE_THRESHOLDS, credit_info.get("debt_to_equity", 0))]
             }
 
         # Analyze market position
@@ -274,8 +361,8 @@ class FinancialAgent:
             market_data = financial_data["market_data"]
             analysis["market_position"] = {
                 "market_cap": market_data.get("market_cap", "Unknown"),
-                "valuation": "Reasonable" if market_data.get("pe_ratio", 0) < 25 else "High",
-                "size": "Large Cap" if "B" in str(market_data.get("market_cap", "")) else "Small/Mid Cap"
+                "valuation": _VALUATION_LABELS[bisect_right(_VALUATION_THRESHOLDS, market_data.get("pe_ratio", 0))],
+                "size": _LARGE_CAP if "B" in str(market_data.get("market_cap", "")) else _SMALL_MID_CAP
             }
 
         # Risk assessment
@@ -320,31 +407,18 @@ class FinancialAgent:
 
     def _extract_citations(self, financial_data: dict) -> list[str]:
         """Extract citations from financial data sources"""
-        citations = []
-
-        if financial_data.get("sources"):
-            citations.extend(financial_data["sources"])
-
-        if financial_data.get("sec_filings"):
-            for filing in financial_data["sec_filings"]:
-                citations.append(f"SEC Filing {filing['type']} - {filing['date']}")
-
+        filings = financial_data.get("sec_filings") or ()
+        citations = list(financial_data.get("sources") or ())
+        citations += [f"SEC Filing {filing['type']} - {filing['date']}" for filing in filings]
         return citations
 
     def _calculate_confidence(self, results: dict, financial_data: dict) -> float:
         """Calculate confidence score based on data quality and completeness"""
-        confidence_factors = []
-
-        # Data completeness
-        if financial_data.get("sec_filings"):
-            confidence_factors.append(0.3)
-        if financial_data.get("market_data"):
-            confidence_factors.append(0.25)
-        if financial_data.get("credit_info"):
-            confidence_factors.append(0.25)
-
-        # Source reliability
-        reliable_sources = len(financial_data.get("sources", []))
-        confidence_factors.append(min(reliable_sources * 0.05, 0.2))
-
-        return min(sum(confidence_factors), 1.0)
+        # Data completeness looked up by presence mask, plus capped source reliability
+        mask = (
+            bool(financial_data.get("sec_filings")) << 2
+            | bool(financial_data.get("market_data")) << 1
+            | bool(financial_data.get("credit_info"))
+        )
+        source_score = min(len(financial_data.get("sources", [])) * 0.05, 0.2)
+        return min(_COMPLETENESS_SCORES[mask] + source_score, 1.0)
@@ -1,196 +1,336 @@
+import asyncio
+import copy
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from langchain_community.tools.tavily_search import TavilySearchResults
+import structlog
 from langchain_core.tools import tool
-from langchain_exa import ExaFindSimilarResults, ExaSearchResults
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import create_react_agent
 
+from src.agents.clients import get_chat_model
 from src.config.settings import settings
-from src.state.definitions import ResearchTask
+from src.memory.cache import ResponseCache, prompt_key
+from src.state.definitions import ResearchTask, TaskResult
+
+logger = structlog.get_logger(__name__)
+
+# Keywords that flag each legal focus area, matched case-insensitively
+# anywhere in the task description
+_FOCUS_KEYWORDS = MappingProxyType({
+    "litigation": frozenset({"litigation", "lawsuit"}),
+    "compliance": frozenset({"compliance", "regulation"}),
+    "sanctions": frozenset({"sanctions", "aml"}),
+    "intellectual_property": frozenset({"patent", "trademark"}),
+    "corporate_governance": frozenset({"governance", "board"}),
+    "regulatory": frozenset({"regulatory", "sec"}),
+})
+
+# Jurisdictions in priority order; anything unmatched defaults to US
+_JURISDICTION_KEYWORDS = MappingProxyType({
+    "EU": frozenset({"eu", "europe"}),
+    "UK": frozenset({"uk", "britain"}),
+})
+
+# One named group per focus area and jurisdiction, so a single scan finds
+# every term. The lookahead keeps matches zero-width so overlapping
+# keywords are all reported, like plain substring checks.
+_LEGAL_TERMS_RE = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<{name}>{'|'.join(sorted(keywords))})"
+        for name, keywords in {**_FOCUS_KEYWORDS, **_JURISDICTION_KEYWORDS}.items()
+    )
+    + ")",
+    re.IGNORECASE,
+)
+
+# Whitespace-delimited token followed by a corporate suffix token, e.g. "Acme Corp"
+_ENTITY_RE = re.compile(r"(?<!\S)(\S+)\s+(corp|inc|llc|ltd|company)(?!\S)", re.IGNORECASE)
+
+# Dollar amounts such as "$2.5M", "$850K" or "$1.2B"
+_AMOUNT_RE = re.compile(r"\$?\s*([\d,]*\.?\d+)\s*([KMB]?)", re.IGNORECASE)
+_AMOUNT_MULTIPLIERS = {"": 1.0, "K": 1e3, "M": 1e6, "B": 1e9}
+
+# Active cases at or above this amount count as material
+_MATERIAL_AMOUNT = 1e6
+
+# Litigation risk indexed by active case count; four or more is High
+_LITIGATION_RISK_BY_ACTIVE_COUNT = ("Low", "Moderate", "Moderate", "Moderate", "High")
+
+# Confidence contributed by each legal data set when it is present
+_CONFIDENCE_WEIGHTS = {
+    "litigation_records": 0.25,
+    "compliance_status": 0.25,
+    "sanctions_screening": 0.3,
+    "regulatory_filings": 0.2,
+}
+
+# Returned when no entity can be identified in a task description
+_UNKNOWN_ENTITY = "Unknown Entity"
+
+# Recently gathered legal data keyed on normalized entity name, focus areas
+# and jurisdiction
+_legal_data_cache = ResponseCache(maxsize=256, ttl=settings.response_cache_ttl)
+
+# Focus area -> (legal_data key, fetcher method) for concurrent data gathering
+_FETCHERS_BY_AREA = {
+    "litigation": ("litigation_records", "_fetch_litigation"),
+    "compliance": ("compliance_status", "_fetch_compliance"),
+    "sanctions": ("sanctions_screening", "_fetch_sanctions"),
+    "intellectual_property": ("ip_portfolio", "_fetch_ip"),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class LitigationCase:
+    """Litigation record with its amount parsed to dollars at ingest"""
+    case_id: str
+    court: str
+    status: str
+    filed_date: str
+    case_type: str
+    amount: str
+    amount_usd: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "amount_usd", _parse_amount(self.amount))
+
+
+# Retried and re-planned tasks repeat descriptions verbatim, so the scans
+# below are memoized; both return immutable values that are safe to share.
+@lru_cache(maxsize=1024)
+def _match_legal_terms(description: str) -> frozenset[str]:
+    """Return the focus areas and jurisdictions mentioned in a description"""
+    # Find every focus-area and jurisdiction term in one regex pass
+    return frozenset(match.lastgroup for match in _LEGAL_TERMS_RE.finditer(description))
+
+
+@lru_cache(maxsize=1024)
+def _match_entity_name(description: str) -> str:
+    """Return the first "<name> <corporate suffix>" pair in a description"""
+    # Simple extraction - in real implementation would use NLP
+    match = _ENTITY_RE.search(description)
+    if match:
+        return f"{match.group(1)} {match.group(2)}"
+    return _UNKNOWN_ENTITY
+
+
+def _parse_amount(amount: str) -> float:
+    """Parse a case amount like "$2.5M" into dollars, or 0.0 if unparseable"""
+    match = _AMOUNT_RE.search(amount)
+    if not match:
+        return 0.0
+    value, suffix = match.groups()
+    return float(value.replace(",", "")) * _AMOUNT_MULTIPLIERS[suffix.upper()]
+
+
+# Mock legal tools for services without public APIs, defined once at import
+@tool
+def sanctions_screening(entity_name: str, lists: str = "OFAC,EU,UN") -> str:
+    """Screen entity against sanctions lists and watch lists"""
+    # Mock implementation - would integrate with sanctions screening services
+    return f"Mock sanctions screening for {entity_name} against lists: {lists} - Status: Clear"
+
+
+@tool
+def litigation_database_search(entity_name: str, court_level: str = "all") -> str:
+    """Search specialized litigation databases for case records"""
+    # Mock implementation - would integrate with Westlaw, LexisNexis, etc.
+    return f"Mock litigation database search for {entity_name}, court level: {court_level}"
+
+
+@tool
+def compliance_regulatory_check(entity_name: str, industry: str = "", regulations: str = "") -> str:
+    """Check regulatory compliance status across multiple agencies"""
+    # Mock implementation - would integrate with regulatory databases
+    return f"Mock compliance check for {entity_name} in {industry}, regulations: {regulations}"
+
+
+@tool
+def dummy_legal_search(query: str, legal_area: str = "") -> str:
+    """Dummy legal search tool for development/testing"""
+    return f"Mock legal search results for: {query} | Legal area: {legal_area}"
+
+
+_LEGAL_MOCK_TOOLS = (sanctions_screening, litigation_database_search, compliance_regulatory_check)
+
+
+# Kept free of per-task values so the provider-side prefix cache stays warm
+# across legal tasks; entity and task details travel in the message list.
+_LEGAL_PROMPT = """You are a legal research and compliance specialist focused on comprehensive legal due diligence.
+
+AVAILABLE TOOLS:
+- exa_legal_comprehensive: Large-scale legal research (35+ results) with full content from courts and regulators
+- exa_court_records: Deep court records and case law search with full content
+- exa_regulatory_compliance: Regulatory filings and enforcement actions with full content
+- exa_legal_keyword: Precise search for legal terms, case citations, statute numbers
+- exa_find_similar_legal: Similar legal documents and precedents for expanded analysis
+- tavily_urgent_legal_news: ONLY for urgent legal breaking news (use minimally)
+- sanctions_screening: Screen entities against OFAC, EU, and UN sanctions lists
+- litigation_database_search: Search specialized litigation databases for case records
+- compliance_regulatory_check: Check regulatory compliance across multiple agencies
+
+LEGAL RESEARCH STRATEGY (EXA-DOMINATED):
+1. Start with exa_legal_comprehensive for broad legal landscape analysis with full content
+2. Use exa_court_records for deep dive into case law and judicial decisions
+3. Use exa_regulatory_compliance for enforcement actions and regulatory compliance
+4. Use exa_legal_keyword for specific legal terms, citations, or statute numbers
+5. Use exa_find_similar_legal to expand research through similar cases and precedents
+6. Always run sanctions_screening for compliance due diligence
+7. Use litigation_database_search for specialized case history
+8. Use compliance_regulatory_check for multi-agency compliance status
+9. ONLY use tavily_urgent_legal_news for immediate legal breaking news (last resort)
+10. Always leverage full content extraction and highlights for comprehensive legal analysis
+
+KEY FOCUS AREAS:
+- Litigation: Active cases, settlements, judgments, class actions
+- Regulatory Compliance: SEC violations, FTC actions, industry-specific compliance
+- Sanctions & AML: OFAC screening, EU sanctions, UN sanctions, PEP lists
+- Corporate Governance: Board issues, executive misconduct, governance failures
+- Intellectual Property: Patent disputes, trademark conflicts, IP litigation
+- Employment Law: Labor violations, discrimination cases, workplace safety
+
+QUALITY STANDARDS:
+- Prioritize official government sources (courts, regulators, agencies)
+- Always verify sanctions screening results across multiple lists
+- Note case status (active, settled, dismissed) and materiality
+- Extract specific citation numbers, filing dates, and court jurisdictions
+- Flag any patterns of recurring legal issues or compliance failures
+- Cross-verify legal findings from multiple authoritative sources
+"""
+
+
+@lru_cache(maxsize=1)
+def _build_legal_tools() -> tuple:
+    """Build the legal tool suite once per process"""
+    tools = []
+
+    # Add comprehensive Exa tools for legal research
+    if settings.has_exa_key:
+        try:
+            from langchain_exa import ExaFindSimilarResults, ExaSearchResults
+
+            # Comprehensive legal document neural search
+            tools.append(ExaSearchResults(
+                name="exa_legal_comprehensive",
+                description="Large-scale legal research with full content from courts, regulators, and legal sources. For thorough legal due diligence.",
+                num_results=35,
+                api_key=settings.exa_api_key,
+                include_domains=[
+                    "courtlistener.com", "justia.com", "findlaw.com",
+                    "sec.gov", "ftc.gov", "justice.gov", "uscourts.gov",
+                    "supremecourt.gov", "law.cornell.edu", "caselaw.findlaw.com"
+                ],
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Court records and case law search
+            tools.append(ExaSearchResults(
+                name="exa_court_records",
+                description="Deep search for court records, case law, and judicial decisions with full content",
+                num_results=20,
+                api_key=settings.exa_api_key,
+                include_domains=[
+                    "courtlistener.com", "justia.com", "uscourts.gov",
+                    "supremecourt.gov", "pacer.gov", "ca9.uscourts.gov"
+                ],
+                type="auto",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Regulatory and compliance search
+            tools.append(ExaSearchResults(
+                name="exa_regulatory_compliance",
+                description="Search regulatory filings, compliance updates, and enforcement actions with full content",
+                num_results=18,
+                api_key=settings.exa_api_key,
+                include_domains=[
+                    "sec.gov", "ftc.gov", "justice.gov", "cftc.gov",
+                    "occ.gov", "federalregister.gov", "regulations.gov"
+                ],
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Legal keyword search for precise terms
+            tools.append(ExaSearchResults(
+                name="exa_legal_keyword",
+                description="Precise keyword search for specific legal terms, case citations, or statute numbers",
+                num_results=12,
+                api_key=settings.exa_api_key,
+                type="keyword",
+                text_contents_options=True
+            ))
+
+            # Find similar legal documents for precedent research
+            tools.append(ExaFindSimilarResults(
+                name="exa_find_similar_legal",
+                description="Find similar legal documents, cases, and precedents for expanded legal analysis",
+                num_results=10,
+                api_key=settings.exa_api_key,
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            logger.info("legal_exa_tools_initialized", count=len(tools))
+        except Exception as e:
+            logger.warning("legal_exa_tools_failed", error=str(e))
+
+    # Add minimal Tavily for urgent legal breaking news only
+    if settings.has_tavily_key:
+        try:
+            from langchain_community.tools.tavily_search import TavilySearchResults
+
+            tools.append(TavilySearchResults(
+                name="tavily_urgent_legal_news",
+                description="ONLY for urgent legal breaking news and immediate court decisions within hours. Use minimally - Exa is primary source.",
+                max_results=3,
+                api_wrapper_kwargs={"api_key": settings.tavily_api_key}
+            ))
+            logger.info("legal_tavily_tool_initialized")
+        except Exception as e:
+            logger.warning("legal_tavily_tool_failed", error=str(e))
+
+    # Specialized legal tools without public APIs, as mock implementations
+    tools.extend(_LEGAL_MOCK_TOOLS)
+
+    # Add fallback tools if no APIs available
+    if not any(tool.name in ['legal_documents_search', 'legal_news_search'] for tool in tools):
+        tools.append(dummy_legal_search)
+        logger.warning("legal_dummy_tools_in_use", hint="configure API keys for real functionality")
+
+    return tuple(tools)
+
+
+@lru_cache(maxsize=8)
+def _build_legal_agent(model_name: str):
+    """Build the legal ReAct graph once per model and reuse it across tasks"""
+    from langgraph.prebuilt import create_react_agent
+
+    return create_react_agent(
+        model=get_chat_model(model_name, settings.default_temperature),
+        tools=list(_build_legal_tools()),
+        prompt=_LEGAL_PROMPT,
+        name="legal_agent"
+    )
 
 
 class LegalAgent:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.default_model
-        self.model = ChatOpenAI(
-            model=self.model_name,
-            temperature=settings.default_temperature,
-            api_key=settings.openai_api_key
-        )
-        self.tools = self._initialize_tools()
-
-    def _initialize_tools(self):
-        tools = []
-
-        # Add comprehensive Exa tools for legal research
-        if settings.has_exa_key:
-            try:
-                # Comprehensive legal document neural search
-                tools.append(ExaSearchResults(
-                    name="exa_legal_comprehensive",
-                    description="Large-scale legal research with full content from courts, regulators, and legal sources. For thorough legal due diligence.",
-                    num_results=35,
-                    api_key=settings.exa_api_key,
-                    include_domains=[
-                        "courtlistener.com", "justia.com", "findlaw.com",
-                        "sec.gov", "ftc.gov", "justice.gov", "uscourts.gov",
-                        "supremecourt.gov", "law.cornell.edu", "caselaw.findlaw.com"
-                    ],
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Court records and case law search
-                tools.append(ExaSearchResults(
-                    name="exa_court_records",
-                    description="Deep search for court records, case law, and judicial decisions with full content",
-                    num_results=20,
-                    api_key=settings.exa_api_key,
-                    include_domains=[
-                        "courtlistener.com", "justia.com", "uscourts.gov",
-                        "supremecourt.gov", "pacer.gov", "ca9.uscourts.gov"
-                    ],
-                    type="auto",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Regulatory and compliance search
-                tools.append(ExaSearchResults(
-                    name="exa_regulatory_compliance",
-                    description="Search regulatory filings, compliance updates, and enforcement actions with full content",
-                    num_results=18,
-                    api_key=settings.exa_api_key,
-                    include_domains=[
-                        "sec.gov", "ftc.gov", "justice.gov", "cftc.gov",
-                        "occ.gov", "federalregister.gov", "regulations.gov"
-                    ],
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Legal keyword search for precise terms
-                tools.append(ExaSearchResults(
-                    name="exa_legal_keyword",
-                    description="Precise keyword search for specific legal terms, case citations, or statute numbers",
-                    num_results=12,
-                    api_key=settings.exa_api_key,
-                    type="keyword",
-                    text_contents_options=True
-                ))
-
-                # Find similar legal documents for precedent research
-                tools.append(ExaFindSimilarResults(
-                    name="exa_find_similar_legal",
-                    description="Find similar legal documents, cases, and precedents for expanded legal analysis",
-                    num_results=10,
-                    api_key=settings.exa_api_key,
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                print("✅ Advanced Exa legal tool suite initialized successfully")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Exa legal tools: {e}")
-
-        # Add minimal Tavily for urgent legal breaking news only
-        if settings.has_tavily_key:
-            try:
-                tools.append(TavilySearchResults(
-                    name="tavily_urgent_legal_news",
-                    description="ONLY for urgent legal breaking news and immediate court decisions within hours. Use minimally - Exa is primary source.",
-                    max_results=3,
-                    api_wrapper_kwargs={"api_key": settings.tavily_api_key}
-                ))
-                print("✅ Tavily auxiliary legal tool initialized")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Tavily legal tool: {e}")
-
-        # Add specialized legal tools that don't have public APIs as mock implementations
-        @tool
-        def sanctions_screening(entity_name: str, lists: str = "OFAC,EU,UN") -> str:
-            """Screen entity against sanctions lists and watch lists"""
-            # Mock implementation - would integrate with sanctions screening services
-            return f"Mock sanctions screening for {entity_name} against lists: {lists} - Status: Clear"
-
-        @tool
-        def litigation_database_search(entity_name: str, court_level: str = "all") -> str:
-            """Search specialized litigation databases for case records"""
-            # Mock implementation - would integrate with Westlaw, LexisNexis, etc.
-            return f"Mock litigation database search for {entity_name}, court level: {court_level}"
-
-        @tool
-        def compliance_regulatory_check(entity_name: str, industry: str = "", regulations: str = "") -> str:
-            """Check regulatory compliance status across multiple agencies"""
-            # Mock implementation - would integrate with regulatory databases
-            return f"Mock compliance check for {entity_name} in {industry}, regulations: {regulations}"
-
-        tools.extend([sanctions_screening, litigation_database_search, compliance_regulatory_check])
-
-        # Add fallback tools if no APIs available
-        if not any(tool.name in ['legal_documents_search', 'legal_news_search'] for tool in tools):
-            @tool
-            def dummy_legal_search(query: str, legal_area: str = "") -> str:
-                """Dummy legal search tool for development/testing"""
-                return f"Mock legal search results for: {query} | Legal area: {legal_area}"
-
-            tools.append(dummy_legal_search)
-            print("⚠️ Using dummy legal tools - configure API keys for real functionality")
-
-        return tools
+        self.model = get_chat_model(self.model_name, settings.default_temperature)
+        self.tools = list(_build_legal_tools())
 
     def create_agent(self):
-        return create_react_agent(
-            model=self.model,
-            tools=self.tools,
-            prompt="""You are a legal research and compliance specialist focused on comprehensive legal due diligence.
-
-            AVAILABLE TOOLS:
-            - exa_legal_comprehensive: Large-scale legal research (35+ results) with full content from courts and regulators
-            - exa_court_records: Deep court records and case law search with full content
-            - exa_regulatory_compliance: Regulatory filings and enforcement actions with full content
-            - exa_legal_keyword: Precise search for legal terms, case citations, statute numbers
-            - exa_find_similar_legal: Similar legal documents and precedents for expanded analysis
-            - tavily_urgent_legal_news: ONLY for urgent legal breaking news (use minimally)
-            - sanctions_screening: Screen entities against OFAC, EU, and UN sanctions lists
-            - litigation_database_search: Search specialized litigation databases for case records
-            - compliance_regulatory_check: Check regulatory compliance across multiple agencies
-
-            LEGAL RESEARCH STRATEGY (EXA-DOMINATED):
-            1. Start with exa_legal_comprehensive for broad legal landscape analysis with full content
-            2. Use exa_court_records for deep dive into case law and judicial decisions
-            3. Use exa_regulatory_compliance for enforcement actions and regulatory compliance
-            4. Use exa_legal_keyword for specific legal terms, citations, or statute numbers
-            5. Use exa_find_similar_legal to expand research through similar cases and precedents
-            6. Always run sanctions_screening for compliance due diligence
-            7. Use litigation_database_search for specialized case history
-            8. Use compliance_regulatory_check for multi-agency compliance status
-            9. ONLY use tavily_urgent_legal_news for immediate legal breaking news (last resort)
-            10. Always leverage full content extraction and highlights for comprehensive legal analysis
-
-            KEY FOCUS AREAS:
-            - Litigation: Active cases, settlements, judgments, class actions
-            - Regulatory Compliance: SEC violations, FTC actions, industry-specific compliance
-            - Sanctions & AML: OFAC screening, EU sanctions, UN sanctions, PEP lists
-            - Corporate Governance: Board issues, executive misconduct, governance failures
-            - Intellectual Property: Patent disputes, trademark conflicts, IP litigation
-            - Employment Law: Labor violations, discrimination cases, workplace safety
-
-            QUALITY STANDARDS:
-            - Prioritize official government sources (courts, regulators, agencies)
-            - Always verify sanctions screening results across multiple lists
-            - Note case status (active, settled, dismissed) and materiality
-            - Extract specific citation numbers, filing dates, and court jurisdictions
-            - Flag any patterns of recurring legal issues or compliance failures
-            - Cross-verify legal findings from multiple authoritative sources
-            """,
-            name="legal_agent"
-        )
+        return _build_legal_agent(self.model_name)
 
-    async def execute_task(self, task: ResearchTask, context: str = "") -> dict[str, Any]:
+    async def execute_task(self, task: ResearchTask, context: str = "") -> TaskResult:
         """Execute legal analysis task with structured approach"""
 
         # Step 1: Extract legal research requirements
@@ -199,6 +339,33 @@ class LegalAgent:
         # Step 2: Gather legal data from multiple sources
         legal_data = await self._gather_legal_data(legal_focus)
 
+        return await self._complete_task(task, legal_focus, legal_data)
+
+    async def execute_tasks(self, tasks: list[ResearchTask], context: str = "") -> list[TaskResult]:
+        """Execute several legal tasks, gathering data once per entity and focus set"""
+        focuses = [self._extract_legal_focus(task.description, context) for task in tasks]
+        keys = [(focus["entity_name"], tuple(focus["focus_areas"])) for focus in focuses]
+        semaphore = asyncio.Semaphore(settings.max_parallel_tasks)
+
+        async def gather(legal_focus: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._gather_legal_data(legal_focus)
+
+        # Tasks screening the same entity for the same areas share one gather
+        pending = {}
+        for key, legal_focus in zip(keys, focuses):
+            if key not in pending:
+                pending[key] = gather(legal_focus)
+        gathered = dict(zip(pending, await asyncio.gather(*pending.values())))
+
+        return list(await asyncio.gather(*(
+            self._complete_task(task, legal_focus, copy.deepcopy(gathered[key]))
+            for task, legal_focus, key in zip(tasks, focuses, keys)
+        )))
+
+    async def _complete_task(self, task: ResearchTask, legal_focus: dict[str, Any], legal_data: dict[str, Any]) -> TaskResult:
+        """Analyze gathered legal data and build the task result"""
+
         # Step 3: Perform legal risk analysis
         legal_analysis = await self._perform_legal_analysis(legal_data, legal_focus)
 
@@ -218,48 +385,40 @@ class LegalAgent:
 
     def _extract_legal_focus(self, description: str, context: str) -> dict[str, Any]:
         """Extract what type of legal analysis is needed"""
-        # Determine focus areas based on task description
-        focus_areas = {
-            "litigation": "litigation" in description.lower() or "lawsuit" in description.lower(),
-            "compliance": "compliance" in description.lower() or "regulation" in description.lower(),
-            "sanctions": "sanctions" in description.lower() or "aml" in description.lower(),
-            "intellectual_property": "patent" in description.lower() or "trademark" in description.lower(),
-            "corporate_governance": "governance" in description.lower() or "board" in description.lower(),
-            "regulatory": "regulatory" in description.lower() or "sec" in description.lower()
-        }
+        hits = _match_legal_terms(description)
+        focus_areas = [area for area in _FOCUS_KEYWORDS if area in hits]
 
         return {
             "entity_name": self._extract_entity_name(description, context),
-            "focus_areas": [area for area, needed in focus_areas.items() if needed],
-            "jurisdiction": self._extract_jurisdiction(description, context),
-            "analysis_type": "comprehensive" if len([a for a in focus_areas.values() if a]) > 2 else "focused"
+            "focus_areas": focus_areas,
+            "jurisdiction": self._extract_jurisdiction(hits),
+            "analysis_type": "comprehensive" if len(focus_areas) > 2 else "focused"
         }
 
     def _extract_entity_name(self, description: str, context: str) -> str:
         """Extract entity name from description or context"""
-        # Simple extraction - in real implementation would use NLP
-        words = description.split()
-        for i, word in enumerate(words):
-            if word.lower() in ["corp", "inc", "llc", "ltd", "company"]:
-                if i > 0:
-                    return f"{words[i-1]} {word}"
-        return "Unknown Entity"
-
-    def _extract_jurisdiction(self, description: str, context: str) -> str:
-        """Extract jurisdiction from description or context"""
-        # Simple extraction - would use more sophisticated parsing in real implementation
-        if "eu" in description.lower() or "europe" in description.lower():
-            return "EU"
-        elif "uk" in description.lower() or "britain" in description.lower():
-            return "UK"
-        else:
-            return "US"  # Default
+        return _match_entity_name(description)
+
+    def _extract_jurisdiction(self, hits: frozenset[str]) -> str:
+        """Pick the jurisdiction from the terms matched in the description"""
+        return next((jurisdiction for jurisdiction in _JURISDICTION_KEYWORDS if jurisdiction in hits), "US")
 
     async def _gather_legal_data(self, legal_focus: dict[str, Any]) -> dict[str, Any]:
         """Gather legal data from multiple sources"""
-        legal_focus["entity_name"]
+        entity_name = legal_focus["entity_name"]
         focus_areas = legal_focus["focus_areas"]
-        legal_focus["jurisdiction"]
+
+        # Repeat screenings of an entity reuse recent results; the key ignores
+        # case, spacing and focus-area order so near-identical tasks match.
+        # Tasks with no identifiable entity are unrelated and never share results.
+        cache_key = None
+        if entity_name != _UNKNOWN_ENTITY:
+            cache_key = prompt_key(
+                " ".join(entity_name.casefold().split()), legal_focus["jurisdiction"], *sorted(focus_areas)
+            )
+            cached = _legal_data_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         legal_data = {
             "litigation_records": [],
@@ -267,57 +426,27 @@ class LegalAgent:
             "sanctions_screening": {},
             "regulatory_filings": [],
             "ip_portfolio": {},
-            "sources": []
+            "sources": [],
+            "errors": []
         }
 
-        # Gather data based on focus areas
-        if "litigation" in focus_areas:
-            # Mock litigation data
-            legal_data["litigation_records"] = [
-                {
-                    "case_id": "2023-CV-001234",
-                    "court": "Superior Court",
-                    "status": "Active",
-                    "filed_date": "2023-01-15",
-                    "case_type": "Contract Dispute",
-                    "amount": "$2.5M"
-                },
-                {
-                    "case_id": "2022-CV-005678",
-                    "court": "Federal District Court",
-                    "status": "Settled",
-                    "filed_date": "2022-06-30",
-                    "case_type": "Employment Law",
-                    "amount": "$850K"
-                }
-            ]
-
-        if "compliance" in focus_areas:
-            # Mock compliance data
-            legal_data["compliance_status"] = {
-                "regulatory_standing": "Good Standing",
-                "last_inspection": "2024-01-15",
-                "violations": 0,
-                "pending_matters": 1
-            }
-
-        if "sanctions" in focus_areas:
-            # Mock sanctions screening
-            legal_data["sanctions_screening"] = {
-                "ofac_status": "Clear",
-                "eu_sanctions": "Clear",
-                "un_sanctions": "Clear",
-                "screening_date": "2024-09-15"
-            }
+        # Query the sources for the requested focus areas concurrently
+        fetches = {
+            data_key: getattr(self, fetcher)(entity_name)
+            for area, (data_key, fetcher) in _FETCHERS_BY_AREA.items()
+            if area in focus_areas
+        }
 
-        if "intellectual_property" in focus_areas:
-            # Mock IP data
-            legal_data["ip_portfolio"] = {
-                "patents": 45,
-                "trademarks": 12,
-                "pending_applications": 8,
-                "disputes": 2
-            }
+        results = await asyncio.gather(
+            *(asyncio.wait_for(fetch, timeout=settings.tool_timeout) for fetch in fetches.values()),
+            return_exceptions=True
+        )
+        for key, result in zip(fetches, results):
+            if isinstance(result, BaseException):
+                # Keep the empty default for a source that errored or timed out
+                legal_data["errors"].append(f"{key}: {type(result).__name__}")
+            else:
+                legal_data[key] = result
 
         legal_data["sources"].extend([
             "Legal Database Search Results",
@@ -326,8 +455,64 @@ class LegalAgent:
             "Sanctions Screening Services"
         ])
 
+        # Partial results are not cached so a failed source is retried next time
+        if cache_key is not None and not legal_data["errors"]:
+            _legal_data_cache.set(cache_key, legal_data)
+
         return legal_data
 
+    async def _fetch_litigation(self, entity_name: str) -> list[LitigationCase]:
+        """Fetch litigation records for the entity"""
+        # Mock litigation data
+        return [
+            LitigationCase(
+                case_id="2023-CV-001234",
+                court="Superior Court",
+                status="Active",
+                filed_date="2023-01-15",
+                case_type="Contract Dispute",
+                amount="$2.5M"
+            ),
+            LitigationCase(
+                case_id="2022-CV-005678",
+                court="Federal District Court",
+                status="Settled",
+                filed_date="2022-06-30",
+                case_type="Employment Law",
+                amount="$850K"
+            )
+        ]
+
+    async def _fetch_compliance(self, entity_name: str) -> dict[str, Any]:
+        """Fetch regulatory compliance status for the entity"""
+        # Mock compliance data
+        return {
+            "regulatory_standing": "Good Standing",
+            "last_inspection": "2024-01-15",
+            "violations": 0,
+            "pending_matters": 1
+        }
+
+    async def _fetch_sanctions(self, entity_name: str) -> dict[str, Any]:
+        """Screen the entity against sanctions lists"""
+        # Mock sanctions screening
+        return {
+            "ofac_status": "Clear",
+            "eu_sanctions": "Clear",
+            "un_sanctions": "Clear",
+            "screening_date": "2024-09-15"
+        }
+
+    async def _fetch_ip(self, entity_name: str) -> dict[str, Any]:
+        """Fetch the intellectual property portfolio for the entity"""
+        # Mock IP data
+        return {
+            "patents": 45,
+            "trademarks": 12,
+            "pending_applications": 8,
+            "disputes": 2
+        }
+
     async def _perform_legal_analysis(self, legal_data: dict, legal_focus: dict) -> dict[str, Any]:
         """Perform comprehensive legal risk analysis"""
         analysis = {
@@ -340,48 +525,58 @@ class LegalAgent:
             "recommendations": []
         }
 
+        sanctions = legal_data.get("sanctions_screening") or {}
+        compliance = legal_data.get("compliance_status") or {}
+        ofac_status = sanctions.get("ofac_status", "Unknown")
+        violations = compliance.get("violations", 0)
+
         # Analyze legal standing
         analysis["legal_standing"] = {
-            "sanctions_status": legal_data.get("sanctions_screening", {}).get("ofac_status", "Unknown"),
-            "regulatory_compliance": legal_data.get("compliance_status", {}).get("regulatory_standing", "Unknown"),
+            "sanctions_status": ofac_status,
+            "regulatory_compliance": compliance.get("regulatory_standing", "Unknown"),
             "active_litigation": len(legal_data.get("litigation_records", []))
         }
 
+        # Tally active cases, exposure and material cases in one pass
+        active_count = 0
+        total_exposure = 0.0
+        material_count = 0
+        for case in legal_data.get("litigation_records", ()):
+            if case.status != "Active":
+                continue
+            active_count += 1
+            total_exposure += case.amount_usd
+            material_count += case.amount_usd >= _MATERIAL_AMOUNT
+
         # Risk assessment
-        active_cases = [case for case in legal_data.get("litigation_records", []) if case.get("status") == "Active"]
         analysis["risk_assessment"] = {
-            "litigation_risk": "High" if len(active_cases) > 3 else "Moderate" if len(active_cases) > 0 else "Low",
-            "compliance_risk": "Low" if legal_data.get("compliance_status", {}).get("violations", 0) == 0 else "High",
-            "sanctions_risk": "Low" if legal_data.get("sanctions_screening", {}).get("ofac_status") == "Clear" else "High"
+            "litigation_risk": _LITIGATION_RISK_BY_ACTIVE_COUNT[min(active_count, len(_LITIGATION_RISK_BY_ACTIVE_COUNT) - 1)],
+            "compliance_risk": "Low" if violations == 0 else "High",
+            "sanctions_risk": "Low" if ofac_status == "Clear" else "High"
         }
 
         # Compliance status
-        analysis["compliance_status"] = legal_data.get("compliance_status", {})
+        analysis["compliance_status"] = compliance
 
         # Litigation exposure
-        total_exposure = sum(
-            float(case.get("amount", "$0").replace("$", "").replace("M", "000000").replace("K", "000"))
-            for case in legal_data.get("litigation_records", [])
-            if case.get("status") == "Active"
-        )
         analysis["litigation_exposure"] = {
-            "active_cases": len(active_cases),
+            "active_cases": active_count,
             "total_exposure": f"${total_exposure:,.0f}",
-            "material_cases": len([case for case in active_cases if "M" in case.get("amount", "")])
+            "material_cases": material_count
         }
 
         # Identify red flags
-        if legal_data.get("sanctions_screening", {}).get("ofac_status") != "Clear":
+        if ofac_status != "Clear":
             analysis["red_flags"].append("Entity appears on sanctions list")
 
-        if len(active_cases) > 5:
+        if active_count > 5:
             analysis["red_flags"].append("High volume of active litigation")
 
-        if legal_data.get("compliance_status", {}).get("violations", 0) > 0:
+        if violations > 0:
             analysis["red_flags"].append("Recent regulatory violations")
 
         # Recommendations
-        if len(active_cases) > 0:
+        if active_count > 0:
             analysis["recommendations"].append("Monitor active litigation for material developments")
 
         analysis["recommendations"].append("Maintain regular sanctions screening")
@@ -416,33 +611,15 @@ class LegalAgent:
 
     def _extract_citations(self, legal_data: dict) -> list[str]:
         """Extract citations from legal data sources"""
-        citations = []
-
-        if legal_data.get("sources"):
-            citations.extend(legal_data["sources"])
-
-        if legal_data.get("litigation_records"):
-            for case in legal_data["litigation_records"]:
-                citations.append(f"Case {case['case_id']} - {case['court']}")
-
-        return citations
+        cases = legal_data.get("litigation_records") or ()
+        # dict.fromkeys drops repeats while keeping first-seen order
+        citations = dict.fromkeys(legal_data.get("sources") or ())
+        citations.update(dict.fromkeys(f"Case {case.case_id} - {case.court}" for case in cases))
+        return list(citations)
 
     def _calculate_confidence(self, results: dict, legal_data: dict) -> float:
         """Calculate confidence score based on data quality and completeness"""
-        confidence_factors = []
-
-        # Data completeness
-        if legal_data.get("litigation_records"):
-            confidence_factors.append(0.25)
-        if legal_data.get("compliance_status"):
-            confidence_factors.append(0.25)
-        if legal_data.get("sanctions_screening"):
-            confidence_factors.append(0.3)
-        if legal_data.get("regulatory_filings"):
-            confidence_factors.append(0.2)
-
-        # Source reliability
-        reliable_sources = len(legal_data.get("sources", []))
-        confidence_factors.append(min(reliable_sources * 0.03, 0.15))
-
-        return min(sum(confidence_factors), 1.0)
+        # Weighted data completeness plus capped source reliability
+        completeness = sum(weight for key, weight in _CONFIDENCE_WEIGHTS.items() if legal_data.get(key))
+        source_score = min(len(legal_data.get("sources", ())) * 0.03, 0.15)
+        return min(completeness + source_score, 1.0)
@@ -1,213 +1,365 @@
+import asyncio
+import copy
+import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any
 
-from langchain_community.tools.tavily_search import TavilySearchResults
+import structlog
 from langchain_core.tools import tool
-from langchain_exa import ExaFindSimilarResults, ExaSearchResults
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import create_react_agent
 
 from src.config.settings import settings
-from src.state.definitions import ResearchTask
+from src.memory.cache import ResponseCache, prompt_key
+from src.state.definitions import ResearchTask, TaskResult
+
+logger = structlog.get_logger(__name__)
+
+# Keywords that flag each OSINT focus area, matched anywhere in the task
+# description regardless of case
+_FOCUS_KEYWORDS = {
+    "social_media": frozenset({"social", "media"}),
+    "digital_footprint": frozenset({"digital", "footprint"}),
+    "domain_analysis": frozenset({"domain", "website"}),
+    "public_records": frozenset({"records", "background"}),
+    "reputation": frozenset({"reputation", "sentiment"}),
+    "security": frozenset({"security", "breach"}),
+    "dark_web": frozenset({"dark web", "threat"}),
+}
+
+_PERSON_KEYWORDS = frozenset({"person", "individual", "ceo", "founder"})
+
+# Entity types checked in priority order
+_ENTITY_TYPE_KEYWORDS = (
+    ("company", frozenset({"corp", "company", "inc", "llc"})),
+    ("person", _PERSON_KEYWORDS),
+    ("digital_asset", frozenset({"website", "domain", "platform"})),
+)
+
+# All focus and entity-type keywords, found in one lookahead scan. Matches are
+# reported per keyword, so one shared by two tables ("website") counts for both;
+# no keyword is a prefix of another, so none is shadowed.
+_OSINT_KEYWORDS = frozenset().union(
+    *_FOCUS_KEYWORDS.values(), *(keywords for _, keywords in _ENTITY_TYPE_KEYWORDS)
+)
+_OSINT_TERMS_RE = re.compile(f"(?=({'|'.join(sorted(_OSINT_KEYWORDS))}))", re.IGNORECASE)
+
+# "<word> <suffix>" company names, and capitalized words as a fallback for people
+_ENTITY_RE = re.compile(r"(?<!\S)(\S+)\s+(corp|inc|llc|ltd|company)(?!\S)", re.IGNORECASE)
+_CAPITALIZED_WORD_RE = re.compile(r"(?<!\S)[A-Z]\S{2,}")
+
+# Focus area -> (osint_data key, fetcher method); dark_web has no data source yet
+_FETCHERS_BY_AREA = {
+    "social_media": ("social_media_profiles", "_fetch_social_media"),
+    "digital_footprint": ("digital_footprint", "_fetch_digital_footprint"),
+    "domain_analysis": ("domain_information", "_fetch_domain_info"),
+    "public_records": ("public_records", "_fetch_public_records"),
+    "reputation": ("reputation_data", "_fetch_reputation"),
+    "security": ("security_findings", "_fetch_security"),
+}
+
+# Data completeness weights used by _calculate_confidence
+_CONFIDENCE_WEIGHTS = {
+    "social_media_profiles": 0.25,
+    "digital_footprint": 0.2,
+    "domain_information": 0.15,
+    "public_records": 0.2,
+    "security_findings": 0.2,
+}
+
+# Recent lookups per fetcher and entity. Breach data goes stale fastest and
+# reputation slowest; other sources use RESPONSE_CACHE_TTL.
+_fetch_cache = ResponseCache(maxsize=512, ttl=settings.response_cache_ttl)
+_FETCH_TTLS = {
+    "_fetch_security": 3600.0,
+    "_fetch_reputation": 86400.0,
+}
+
+# Returned when no entity can be identified; such lookups are never shared
+_UNKNOWN_ENTITY = "Unknown Entity"
+
+# Lookups currently running, so concurrent tasks on one entity share a call
+_inflight_fetches: dict[str, asyncio.Future] = {}
+
+# Domains searched by the Exa OSINT tools
+_SOCIAL_DOMAINS = (
+    "linkedin.com", "twitter.com", "facebook.com", "instagram.com",
+    "youtube.com", "tiktok.com", "reddit.com", "github.com",
+    "stackoverflow.com", "medium.com", "crunchbase.com",
+    "angellist.com", "producthunt.com", "hackernews.com"
+)
+
+_PUBLIC_RECORDS_DOMAINS = (
+    "whitepages.com", "spokeo.com", "sec.gov", "irs.gov",
+    "census.gov", "usa.gov", "corporationwiki.com", "bizapedia.com",
+    "manta.com", "opencorporates.com", "fec.gov"
+)
+
+_REPUTATION_DOMAINS = (
+    "reuters.com", "bloomberg.com", "wsj.com", "forbes.com",
+    "techcrunch.com", "businesswire.com", "prnewswire.com",
+    "glassdoor.com", "trustpilot.com", "bbb.org", "yelp.com",
+    "ripoffreport.com", "complaintsboard.com"
+)
+
+
+_OSINT_PROMPT = """You are an Open Source Intelligence (OSINT) specialist focused on comprehensive digital investigations using publicly available information.
+
+AVAILABLE TOOLS:
+- exa_osint_comprehensive: Large-scale OSINT investigation (40+ results) with full content across all digital platforms
+- exa_public_records: Deep public records search with full content from directories and government databases
+- exa_reputation_monitoring: Comprehensive reputation monitoring (30+ results) with full content and sentiment analysis
+- exa_osint_keyword: Precise keyword search for specific names, usernames, emails, or identifiers
+- exa_find_similar_digital_assets: Similar digital assets and related entities for expanded investigation
+- tavily_urgent_osint: ONLY for urgent real-time OSINT updates (use minimally)
+- domain_technical_analysis: Analyze domain registration, DNS records, and hosting infrastructure
+- breach_security_monitoring: Check for data breaches, exposed credentials, and security incidents
+- dark_web_threat_monitoring: Monitor underground sources for entity mentions and potential threats
+- digital_forensics_analysis: Perform passive digital forensics analysis on online presence
+
+OSINT INVESTIGATION STRATEGY (EXA-DOMINATED):
+1. Start with exa_osint_comprehensive for broad digital footprint analysis with full content
+2. Use exa_public_records for deep dive into official records and business information
+3. Use exa_reputation_monitoring for comprehensive reputation analysis with full articles
+4. Use exa_osint_keyword for precise searches of specific identifiers or terms
+5. Use exa_find_similar_digital_assets to expand investigation to related entities
+6. Use domain_technical_analysis for technical infrastructure assessment
+7. Use breach_security_monitoring to identify security incidents and data exposure
+8. Use dark_web_threat_monitoring for threat intelligence and underground mentions
+9. Use digital_forensics_analysis for detailed technical assessment when needed
+10. ONLY use tavily_urgent_osint for immediate breaking developments (last resort)
+11. Always leverage full content extraction and highlights for comprehensive OSINT analysis
+
+KEY INVESTIGATION AREAS:
+- Digital Presence: Social media profiles, professional networks, online activity patterns
+- Public Records: Business registrations, government filings, directory listings
+- Reputation Intelligence: News coverage, reviews, sentiment analysis, controversy assessment
+- Technical Infrastructure: Domain analysis, hosting providers, SSL certificates, DNS records
+- Security Posture: Data breaches, exposed information, credential leaks, security incidents
+- Threat Intelligence: Dark web mentions, threat actor discussions, potential risks
+
+OPERATIONAL SECURITY & ETHICS:
+- Use only publicly available information - no unauthorized access or illegal methods
+- Maintain operational security to avoid attribution or detection
+- Verify findings across multiple independent sources before reporting
+- Document methodology and assess source reliability for each finding
+- Respect privacy laws and ethical boundaries in all investigations
+- Flag any suspicious or concerning activity patterns discovered
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class SocialProfile:
+    """Social media profile found for an investigated entity"""
+    platform: str
+    profile_url: str
+    followers: int
+    activity_level: str
+    last_post: str
+
+
+# Re-planned and retried tasks reuse descriptions verbatim, so these scans are
+# memoized; both return immutable values
+@lru_cache(maxsize=1024)
+def _match_osint_terms(description: str) -> frozenset[str]:
+    """Return the lowercased focus and entity-type keywords found in a description"""
+    return frozenset(match.group(1).lower() for match in _OSINT_TERMS_RE.finditer(description))
+
+
+@lru_cache(maxsize=1024)
+def _match_entity_name(description: str) -> str:
+    """Return the company or person name a description refers to"""
+    # Simple extraction - in real implementation would use NLP
+    match = _ENTITY_RE.search(description)
+    if match:
+        return f"{match.group(1)} {match.group(2)}"
+
+    # Look for person names (very basic)
+    if not _PERSON_KEYWORDS.isdisjoint(_match_osint_terms(description)):
+        match = _CAPITALIZED_WORD_RE.search(description)
+        if match:
+            return match.group()
+
+    return _UNKNOWN_ENTITY
+
+
+# Mock OSINT tools for services that need custom integrations, defined once at import
+@tool
+def domain_technical_analysis(domain: str) -> str:
+    """Analyze domain registration, DNS records, hosting details, and technical infrastructure"""
+    # Mock implementation - would integrate with WHOIS, DNS lookup, and hosting analysis tools
+    return f"Mock domain technical analysis for: {domain} - Registrar: GoDaddy, Hosting: AWS, SSL: Valid"
+
+
+@tool
+def breach_security_monitoring(entity_identifier: str, search_type: str = "email") -> str:
+    """Check for data breaches, exposed credentials, and security incidents"""
+    # Mock implementation - would integrate with HaveIBeenPwned, breach databases
+    return f"Mock breach monitoring for {entity_identifier} ({search_type}) - Status: No breaches found"
+
+
+@tool
+def dark_web_threat_monitoring(entity_name: str, monitoring_scope: str = "standard") -> str:
+    """Monitor dark web forums, markets, and underground sources for entity mentions and threats"""
+    # Mock implementation - would integrate with dark web monitoring services
+    return f"Mock dark web monitoring for {entity_name} (scope: {monitoring_scope}) - No threats detected"
+
+
+@tool
+def digital_forensics_analysis(target_identifier: str, analysis_type: str = "passive") -> str:
+    """Perform digital forensics analysis on digital assets and online presence"""
+    # Mock implementation - would integrate with forensics tools and metadata analysis
+    return f"Mock digital forensics analysis for {target_identifier} (type: {analysis_type}) - Clean profile"
+
+
+@tool
+def dummy_osint_search(query: str, osint_type: str = "general") -> str:
+    """Dummy OSINT search tool for development/testing"""
+    return f"Mock OSINT search results for: {query} | Type: {osint_type}"
+
+
+_OSINT_MOCK_TOOLS = (
+    domain_technical_analysis,
+    breach_security_monitoring,
+    dark_web_threat_monitoring,
+    digital_forensics_analysis
+)
+
+
+@lru_cache(maxsize=1)
+def _build_osint_tools() -> tuple:
+    """Build the OSINT tool suite on first use and share it across agents"""
+    tools = []
+
+    # Add comprehensive Exa tools for OSINT investigation
+    if settings.has_exa_key:
+        try:
+            from langchain_exa import ExaFindSimilarResults, ExaSearchResults
+
+            # Comprehensive OSINT neural search across all digital platforms
+            tools.append(ExaSearchResults(
+                name="exa_osint_comprehensive",
+                description="Large-scale OSINT investigation with full content across social media, forums, and digital platforms. For thorough digital footprint analysis.",
+                num_results=40,
+                api_key=settings.exa_api_key,
+                include_domains=list(_SOCIAL_DOMAINS),
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Public records and directories with full content
+            tools.append(ExaSearchResults(
+                name="exa_public_records",
+                description="Deep search of public records, business directories, and government databases with full content extraction",
+                num_results=25,
+                api_key=settings.exa_api_key,
+                include_domains=list(_PUBLIC_RECORDS_DOMAINS),
+                type="auto",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Reputation and news monitoring with sentiment analysis
+            tools.append(ExaSearchResults(
+                name="exa_reputation_monitoring",
+                description="Comprehensive reputation monitoring with full article content and sentiment analysis",
+                num_results=30,
+                api_key=settings.exa_api_key,
+                include_domains=list(_REPUTATION_DOMAINS),
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # OSINT keyword search for precise terms
+            tools.append(ExaSearchResults(
+                name="exa_osint_keyword",
+                description="Precise keyword search for specific names, usernames, emails, or identifiers in OSINT investigation",
+                num_results=15,
+                api_key=settings.exa_api_key,
+                type="keyword",
+                text_contents_options=True
+            ))
+
+            # Find similar digital assets and related entities
+            tools.append(ExaFindSimilarResults(
+                name="exa_find_similar_digital_assets",
+                description="Find similar digital assets, related entities, and connected online presence for expanded OSINT investigation",
+                num_results=12,
+                api_key=settings.exa_api_key,
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            logger.info("osint_exa_tools_initialized", count=len(tools))
+        except Exception as e:
+            logger.warning("osint_exa_tools_failed", error=str(e))
+
+    # Add minimal Tavily for urgent OSINT updates only
+    if settings.has_tavily_key:
+        try:
+            from langchain_community.tools.tavily_search import TavilySearchResults
+
+            tools.append(TavilySearchResults(
+                name="tavily_urgent_osint",
+                description="ONLY for urgent real-time OSINT updates and breaking developments within hours. Use minimally - Exa is primary source.",
+                max_results=3,
+                api_wrapper_kwargs={"api_key": settings.tavily_api_key}
+            ))
+            logger.info("osint_tavily_tool_initialized")
+        except Exception as e:
+            logger.warning("osint_tavily_tool_failed", error=str(e))
+
+    # Specialized OSINT tools that require custom integrations, as mock implementations
+    tools.extend(_OSINT_MOCK_TOOLS)
+
+    # Add fallback tools if no APIs available
+    if not any(tool.name in ['social_media_osint', 'public_records_osint'] for tool in tools):
+        tools.append(dummy_osint_search)
+        logger.warning("osint_dummy_tools_in_use", hint="configure API keys for real functionality")
+
+    return tuple(tools)
 
 
 class OSINTAgent:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.default_model
-        self.model = ChatOpenAI(
-            model=self.model_name,
-            temperature=settings.default_temperature,
-            api_key=settings.openai_api_key
-        )
-        self.tools = self._initialize_tools()
-
-    def _initialize_tools(self):
-        tools = []
-
-        # Add comprehensive Exa tools for OSINT investigation
-        if settings.has_exa_key:
-            try:
-                # Comprehensive OSINT neural search across all digital platforms
-                tools.append(ExaSearchResults(
-                    name="exa_osint_comprehensive",
-                    description="Large-scale OSINT investigation with full content across social media, forums, and digital platforms. For thorough digital footprint analysis.",
-                    num_results=40,
-                    api_key=settings.exa_api_key,
-                    include_domains=[
-                        "linkedin.com", "twitter.com", "facebook.com", "instagram.com",
-                        "youtube.com", "tiktok.com", "reddit.com", "github.com",
-                        "stackoverflow.com", "medium.com", "crunchbase.com",
-                        "angellist.com", "producthunt.com", "hackernews.com"
-                    ],
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Public records and directories with full content
-                tools.append(ExaSearchResults(
-                    name="exa_public_records",
-                    description="Deep search of public records, business directories, and government databases with full content extraction",
-                    num_results=25,
-                    api_key=settings.exa_api_key,
-                    include_domains=[
-                        "whitepages.com", "spokeo.com", "sec.gov", "irs.gov",
-                        "census.gov", "usa.gov", "corporationwiki.com", "bizapedia.com",
-                        "manta.com", "opencorporates.com", "fec.gov"
-                    ],
-                    type="auto",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Reputation and news monitoring with sentiment analysis
-                tools.append(ExaSearchResults(
-                    name="exa_reputation_monitoring",
-                    description="Comprehensive reputation monitoring with full article content and sentiment analysis",
-                    num_results=30,
-                    api_key=settings.exa_api_key,
-                    include_domains=[
-                        "reuters.com", "bloomberg.com", "wsj.com", "forbes.com",
-                        "techcrunch.com", "businesswire.com", "prnewswire.com",
-                        "glassdoor.com", "trustpilot.com", "bbb.org", "yelp.com",
-                        "ripoffreport.com", "complaintsboard.com"
-                    ],
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # OSINT keyword search for precise terms
-                tools.append(ExaSearchResults(
-                    name="exa_osint_keyword",
-                    description="Precise keyword search for specific names, usernames, emails, or identifiers in OSINT investigation",
-                    num_results=15,
-                    api_key=settings.exa_api_key,
-                    type="keyword",
-                    text_contents_options=True
-                ))
-
-                # Find similar digital assets and related entities
-                tools.append(ExaFindSimilarResults(
-                    name="exa_find_similar_digital_assets",
-                    description="Find similar digital assets, related entities, and connected online presence for expanded OSINT investigation",
-                    num_results=12,
-                    api_key=settings.exa_api_key,
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                print("✅ Advanced Exa OSINT tool suite initialized successfully")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Exa OSINT tools: {e}")
-
-        # Add minimal Tavily for urgent OSINT updates only
-        if settings.has_tavily_key:
-            try:
-                tools.append(TavilySearchResults(
-                    name="tavily_urgent_osint",
-                    description="ONLY for urgent real-time OSINT updates and breaking developments within hours. Use minimally - Exa is primary source.",
-                    max_results=3,
-                    api_wrapper_kwargs={"api_key": settings.tavily_api_key}
-                ))
-                print("✅ Tavily auxiliary OSINT tool initialized")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Tavily OSINT tool: {e}")
-
-        # Add specialized OSINT tools that require custom integrations (mock implementations)
-        @tool
-        def domain_technical_analysis(domain: str) -> str:
-            """Analyze domain registration, DNS records, hosting details, and technical infrastructure"""
-            # Mock implementation - would integrate with WHOIS, DNS lookup, and hosting analysis tools
-            return f"Mock domain technical analysis for: {domain} - Registrar: GoDaddy, Hosting: AWS, SSL: Valid"
-
-        @tool
-        def breach_security_monitoring(entity_identifier: str, search_type: str = "email") -> str:
-            """Check for data breaches, exposed credentials, and security incidents"""
-            # Mock implementation - would integrate with HaveIBeenPwned, breach databases
-            return f"Mock breach monitoring for {entity_identifier} ({search_type}) - Status: No breaches found"
-
-        @tool
-        def dark_web_threat_monitoring(entity_name: str, monitoring_scope: str = "standard") -> str:
-            """Monitor dark web forums, markets, and underground sources for entity mentions and threats"""
-            # Mock implementation - would integrate with dark web monitoring services
-            return f"Mock dark web monitoring for {entity_name} (scope: {monitoring_scope}) - No threats detected"
-
-        @tool
-        def digital_forensics_analysis(target_identifier: str, analysis_type: str = "passive") -> str:
-            """Perform digital forensics analysis on digital assets and online presence"""
-            # Mock implementation - would integrate with forensics tools and metadata analysis
-            return f"Mock digital forensics analysis for {target_identifier} (type: {analysis_type}) - Clean profile"
-
-        tools.extend([
-            domain_technical_analysis,
-            breach_security_monitoring,
-            dark_web_threat_monitoring,
-            digital_forensics_analysis
-        ])
 
-        # Add fallback tools if no APIs available
-        if not any(tool.name in ['social_media_osint', 'public_records_osint'] for tool in tools):
-            @tool
-            def dummy_osint_search(query: str, osint_type: str = "general") -> str:
-                """Dummy OSINT search tool for development/testing"""
-                return f"Mock OSINT search results for: {query} | Type: {osint_type}"
+    @cached_property
+    def model(self):
+        """Shared chat model for the ReAct agent, resolved on first use"""
+        from src.agents.clients import get_chat_model
 
-            tools.append(dummy_osint_search)
-            print("⚠️ Using dummy OSINT tools - configure API keys for real functionality")
+        return get_chat_model(self.model_name, settings.default_temperature)
 
-        return tools
+    @cached_property
+    def tools(self) -> list:
+        """OSINT tools for the ReAct agent, built on first use"""
+        return list(_build_osint_tools())
+
+    @cached_property
+    def agent(self):
+        """OSINT ReAct graph, compiled once per agent instance"""
+        from langgraph.prebuilt import create_react_agent
 
-    def create_agent(self):
         return create_react_agent(
             model=self.model,
             tools=self.tools,
-            prompt="""You are an Open Source Intelligence (OSINT) specialist focused on comprehensive digital investigations using publicly available information.
-
-            AVAILABLE TOOLS:
-            - exa_osint_comprehensive: Large-scale OSINT investigation (40+ results) with full content across all digital platforms
-            - exa_public_records: Deep public records search with full content from directories and government databases
-            - exa_reputation_monitoring: Comprehensive reputation monitoring (30+ results) with full content and sentiment analysis
-            - exa_osint_keyword: Precise keyword search for specific names, usernames, emails, or identifiers
-            - exa_find_similar_digital_assets: Similar digital assets and related entities for expanded investigation
-            - tavily_urgent_osint: ONLY for urgent real-time OSINT updates (use minimally)
-            - domain_technical_analysis: Analyze domain registration, DNS records, and hosting infrastructure
-            - breach_security_monitoring: Check for data breaches, exposed credentials, and security incidents
-            - dark_web_threat_monitoring: Monitor underground sources for entity mentions and potential threats
-            - digital_forensics_analysis: Perform passive digital forensics analysis on online presence
-
-            OSINT INVESTIGATION STRATEGY (EXA-DOMINATED):
-            1. Start with exa_osint_comprehensive for broad digital footprint analysis with full content
-            2. Use exa_public_records for deep dive into official records and business information
-            3. Use exa_reputation_monitoring for comprehensive reputation analysis with full articles
-            4. Use exa_osint_keyword for precise searches of specific identifiers or terms
-            5. Use exa_find_similar_digital_assets to expand investigation to related entities
-            6. Use domain_technical_analysis for technical infrastructure assessment
-            7. Use breach_security_monitoring to identify security incidents and data exposure
-            8. Use dark_web_threat_monitoring for threat intelligence and underground mentions
-            9. Use digital_forensics_analysis for detailed technical assessment when needed
-            10. ONLY use tavily_urgent_osint for immediate breaking developments (last resort)
-            11. Always leverage full content extraction and highlights for comprehensive OSINT analysis
-
-            KEY INVESTIGATION AREAS:
-            - Digital Presence: Social media profiles, professional networks, online activity patterns
-            - Public Records: Business registrations, government filings, directory listings
-            - Reputation Intelligence: News coverage, reviews, sentiment analysis, controversy assessment
-            - Technical Infrastructure: Domain analysis, hosting providers, SSL certificates, DNS records
-            - Security Posture: Data breaches, exposed information, credential leaks, security incidents
-            - Threat Intelligence: Dark web mentions, threat actor discussions, potential risks
-
-            OPERATIONAL SECURITY & ETHICS:
-            - Use only publicly available information - no unauthorized access or illegal methods
-            - Maintain operational security to avoid attribution or detection
-            - Verify findings across multiple independent sources before reporting
-            - Document methodology and assess source reliability for each finding
-            - Respect privacy laws and ethical boundaries in all investigations
-            - Flag any suspicious or concerning activity patterns discovered
-            """,
+            prompt=_OSINT_PROMPT,
             name="osint_agent"
         )
 
-    async def execute_task(self, task: ResearchTask, context: str = "") -> dict[str, Any]:
+    def create_agent(self):
+        return self.agent
+
+    async def warmup(self):
+        """Compile the ReAct graph and open API connections before the first task"""
+        from src.agents.clients import warmup_clients
+
+        self.create_agent()
+        await warmup_clients()
+
+    async def execute_task(self, task: ResearchTask, context: str = "") -> TaskResult:
         """Execute OSINT investigation task with structured approach"""
 
         # Step 1: Extract OSINT investigation requirements
@@ -235,57 +387,31 @@ class OSINTAgent:
 
     def _extract_osint_focus(self, description: str, context: str) -> dict[str, Any]:
         """Extract what type of OSINT investigation is needed"""
-        # Determine focus areas based on task description
-        focus_areas = {
-            "social_media": "social" in description.lower() or "media" in description.lower(),
-            "digital_footprint": "digital" in description.lower() or "footprint" in description.lower(),
-            "domain_analysis": "domain" in description.lower() or "website" in description.lower(),
-            "public_records": "records" in description.lower() or "background" in description.lower(),
-            "reputation": "reputation" in description.lower() or "sentiment" in description.lower(),
-            "security": "security" in description.lower() or "breach" in description.lower(),
-            "dark_web": "dark web" in description.lower() or "threat" in description.lower()
-        }
+        hits = _match_osint_terms(description)
+        focus_areas = [area for area, keywords in _FOCUS_KEYWORDS.items() if not keywords.isdisjoint(hits)]
 
         return {
             "entity_name": self._extract_entity_name(description, context),
             "entity_type": self._extract_entity_type(description, context),
-            "focus_areas": [area for area, needed in focus_areas.items() if needed],
-            "investigation_scope": "comprehensive" if len([a for a in focus_areas.values() if a]) > 3 else "targeted"
+            "focus_areas": focus_areas,
+            "investigation_scope": "comprehensive" if len(focus_areas) > 3 else "targeted"
         }
 
     def _extract_entity_name(self, description: str, context: str) -> str:
         """Extract entity name from description or context"""
-        # Simple extraction - in real implementation would use NLP
-        words = description.split()
-        for i, word in enumerate(words):
-            if word.lower() in ["corp", "inc", "llc", "ltd", "company"]:
-                if i > 0:
-                    return f"{words[i-1]} {word}"
-
-        # Look for person names (very basic)
-        if any(keyword in description.lower() for keyword in ["person", "individual", "ceo", "founder"]):
-            # Extract potential name
-            for word in words:
-                if word[0].isupper() and len(word) > 2:
-                    return word
-
-        return "Unknown Entity"
+        return _match_entity_name(description)
 
     def _extract_entity_type(self, description: str, context: str) -> str:
         """Extract entity type from description or context"""
-        if any(keyword in description.lower() for keyword in ["corp", "company", "inc", "llc"]):
-            return "company"
-        elif any(keyword in description.lower() for keyword in ["person", "individual", "ceo", "founder"]):
-            return "person"
-        elif any(keyword in description.lower() for keyword in ["website", "domain", "platform"]):
-            return "digital_asset"
-        else:
-            return "unknown"
+        hits = _match_osint_terms(description)
+        return next(
+            (entity_type for entity_type, keywords in _ENTITY_TYPE_KEYWORDS if not keywords.isdisjoint(hits)),
+            "unknown"
+        )
 
     async def _gather_osint_data(self, osint_focus: dict[str, Any]) -> dict[str, Any]:
         """Gather OSINT data from multiple sources"""
         entity_name = osint_focus["entity_name"]
-        osint_focus["entity_type"]
         focus_areas = osint_focus["focus_areas"]
 
         osint_data = {
@@ -295,86 +421,27 @@ class OSINTAgent:
             "public_records": [],
             "reputation_data": {},
             "security_findings": {},
-            "sources": []
+            "sources": [],
+            "errors": []
         }
 
-        # Gather data based on focus areas
-        if "social_media" in focus_areas:
-            # Mock social media data
-            osint_data["social_media_profiles"] = [
-                {
-                    "platform": "LinkedIn",
-                    "profile_url": f"linkedin.com/company/{entity_name.lower().replace(' ', '-')}",
-                    "followers": 15420,
-                    "activity_level": "Moderate",
-                    "last_post": "2024-09-10"
-                },
-                {
-                    "platform": "Twitter",
-                    "profile_url": f"twitter.com/{entity_name.lower().replace(' ', '')}",
-                    "followers": 8950,
-                    "activity_level": "High",
-                    "last_post": "2024-09-14"
-                }
-            ]
-
-        if "digital_footprint" in focus_areas:
-            # Mock digital footprint data
-            osint_data["digital_footprint"] = {
-                "websites": [f"{entity_name.lower().replace(' ', '')}.com"],
-                "subdomains": 15,
-                "email_patterns": [f"contact@{entity_name.lower().replace(' ', '')}.com"],
-                "technologies": ["React", "AWS", "Cloudflare"],
-                "ssl_status": "Valid",
-                "hosting_provider": "AWS"
-            }
-
-        if "domain_analysis" in focus_areas:
-            # Mock domain information
-            osint_data["domain_information"] = {
-                "registration_date": "2018-03-15",
-                "expiration_date": "2025-03-15",
-                "registrar": "GoDaddy",
-                "privacy_protection": True,
-                "dns_records": ["A", "MX", "TXT", "CNAME"]
-            }
-
-        if "public_records" in focus_areas:
-            # Mock public records
-            osint_data["public_records"] = [
-                {
-                    "type": "Business Registration",
-                    "source": "Secretary of State",
-                    "status": "Active",
-                    "registration_date": "2018-03-15"
-                },
-                {
-                    "type": "Tax Records",
-                    "source": "IRS",
-                    "status": "Current",
-                    "last_filing": "2024-04-15"
-                }
-            ]
-
-        if "reputation" in focus_areas:
-            # Mock reputation data
-            osint_data["reputation_data"] = {
-                "overall_sentiment": "Positive",
-                "news_mentions": 145,
-                "positive_reviews": 78,
-                "negative_reviews": 12,
-                "neutral_coverage": 55
-            }
+        # Run the lookups for every requested focus area at the same time
+        fetches = {
+            data_key: self._cached_fetch(fetcher, entity_name)
+            for area, (data_key, fetcher) in _FETCHERS_BY_AREA.items()
+            if area in focus_areas
+        }
 
-        if "security" in focus_areas:
-            # Mock security findings
-            osint_data["security_findings"] = {
-                "data_breaches": 0,
-                "exposed_credentials": 0,
-                "security_rating": "A-",
-                "vulnerabilities": ["None detected"],
-                "dark_web_mentions": 0
-            }
+        results = await asyncio.gather(
+            *(asyncio.wait_for(fetch, timeout=settings.tool_timeout) for fetch in fetches.values()),
+            return_exceptions=True
+        )
+        for key, result in zip(fetches, results):
+            if isinstance(result, BaseException):
+                # One unavailable source leaves its section empty; the rest still report
+                osint_data["errors"].append(f"{key}: {type(result).__name__}")
+            else:
+                osint_data[key] = result
 
         osint_data["sources"].extend([
             "Social Media Platforms",
@@ -385,6 +452,122 @@ class OSINTAgent:
 
         return osint_data
 
+    async def _cached_fetch(self, fetcher: str, entity_name: str) -> Any:
+        """Run a fetcher, reusing its recent result for the same entity"""
+        # Descriptions without a recognizable entity are unrelated to each other
+        if entity_name == _UNKNOWN_ENTITY:
+            return await getattr(self, fetcher)(entity_name)
+
+        # Case and spacing are normalized so repeat investigations hit
+        key = prompt_key(fetcher, " ".join(entity_name.casefold().split()))
+        cached = _fetch_cache.get(key)
+        if cached is not None:
+            return cached
+
+        pending = _inflight_fetches.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(getattr(self, fetcher)(entity_name))
+            _inflight_fetches[key] = pending
+
+            def finish(future: asyncio.Future):
+                # Cache from the future itself so the result is kept even if
+                # every caller has already timed out; reading the exception
+                # also marks a failed lookup as handled
+                _inflight_fetches.pop(key, None)
+                if not future.cancelled() and future.exception() is None:
+                    _fetch_cache.set(key, future.result(), ttl=_FETCH_TTLS.get(fetcher))
+
+            pending.add_done_callback(finish)
+
+        # Shielded so one caller timing out doesn't cancel the lookup for the others;
+        # every caller gets its own copy of the shared result
+        return copy.deepcopy(await asyncio.shield(pending))
+
+    async def _fetch_social_media(self, entity_name: str) -> list[SocialProfile]:
+        """Fetch social media profiles for the entity"""
+        name = entity_name.lower()
+        # Mock social media data
+        return [
+            SocialProfile(
+                platform="LinkedIn",
+                profile_url=f"linkedin.com/company/{name.replace(' ', '-')}",
+                followers=15420,
+                activity_level="Moderate",
+                last_post="2024-09-10"
+            ),
+            SocialProfile(
+                platform="Twitter",
+                profile_url=f"twitter.com/{name.replace(' ', '')}",
+                followers=8950,
+                activity_level="High",
+                last_post="2024-09-14"
+            )
+        ]
+
+    async def _fetch_digital_footprint(self, entity_name: str) -> dict[str, Any]:
+        """Fetch the entity's websites, email patterns and technology stack"""
+        domain = f"{entity_name.lower().replace(' ', '')}.com"
+        # Mock digital footprint data
+        return {
+            "websites": [domain],
+            "subdomains": 15,
+            "email_patterns": [f"contact@{domain}"],
+            "technologies": ["React", "AWS", "Cloudflare"],
+            "ssl_status": "Valid",
+            "hosting_provider": "AWS"
+        }
+
+    async def _fetch_domain_info(self, entity_name: str) -> dict[str, Any]:
+        """Fetch domain registration details for the entity"""
+        # Mock domain information
+        return {
+            "registration_date": "2018-03-15",
+            "expiration_date": "2025-03-15",
+            "registrar": "GoDaddy",
+            "privacy_protection": True,
+            "dns_records": ["A", "MX", "TXT", "CNAME"]
+        }
+
+    async def _fetch_public_records(self, entity_name: str) -> list[dict[str, Any]]:
+        """Fetch public records filed by or about the entity"""
+        # Mock public records
+        return [
+            {
+                "type": "Business Registration",
+                "source": "Secretary of State",
+                "status": "Active",
+                "registration_date": "2018-03-15"
+            },
+            {
+                "type": "Tax Records",
+                "source": "IRS",
+                "status": "Current",
+                "last_filing": "2024-04-15"
+            }
+        ]
+
+    async def _fetch_reputation(self, entity_name: str) -> dict[str, Any]:
+        """Fetch sentiment and review data for the entity"""
+        # Mock reputation data
+        return {
+            "overall_sentiment": "Positive",
+            "news_mentions": 145,
+            "positive_reviews": 78,
+            "negative_reviews": 12,
+            "neutral_coverage": 55
+        }
+
+    async def _fetch_security(self, entity_name: str) -> dict[str, Any]:
+        """Fetch breach and exposure findings for the entity"""
+        # Mock security findings
+        return {
+            "data_breaches": 0,
+            "exposed_credentials": 0,
+            "security_rating": "A-",
+            "vulnerabilities": ["None detected"],
+            "dark_web_mentions": 0
+        }
+
     async def _perform_osint_analysis(self, osint_data: dict, osint_focus: dict) -> dict[str, Any]:
         """Perform comprehensive OSINT analysis"""
         analysis = {
@@ -397,50 +580,57 @@ class OSINTAgent:
             "recommendations": []
         }
 
+        security_findings = osint_data.get("security_findings") or {}
+        reputation = osint_data.get("reputation_data") or {}
+        privacy_protection = (osint_data.get("domain_information") or {}).get("privacy_protection")
+        breaches = security_findings.get("data_breaches", 0)
+        dark_web_mentions = security_findings.get("dark_web_mentions", 0)
+        positive_reviews = reputation.get("positive_reviews", 0)
+        negative_reviews = reputation.get("negative_reviews", 0)
+
         # Analyze digital presence
-        social_profiles = len(osint_data.get("social_media_profiles", []))
+        social_profiles = len(osint_data.get("social_media_profiles") or ())
         analysis["digital_presence"] = {
             "social_media_coverage": "Comprehensive" if social_profiles >= 3 else "Limited",
-            "website_presence": "Active" if osint_data.get("digital_footprint", {}).get("websites") else "Minimal",
+            "website_presence": "Active" if (osint_data.get("digital_footprint") or {}).get("websites") else "Minimal",
             "brand_consistency": "Good",
             "online_activity": "Regular"
         }
 
         # Security posture assessment
-        security_findings = osint_data.get("security_findings", {})
         analysis["security_posture"] = {
-            "breach_history": "Clean" if security_findings.get("data_breaches", 0) == 0 else "Concerning",
+            "breach_history": "Clean" if breaches == 0 else "Concerning",
             "exposed_data": "None" if security_findings.get("exposed_credentials", 0) == 0 else "Present",
             "security_rating": security_findings.get("security_rating", "Unknown"),
-            "dark_web_presence": "None" if security_findings.get("dark_web_mentions", 0) == 0 else "Detected"
+            "dark_web_presence": "None" if dark_web_mentions == 0 else "Detected"
         }
 
         # Reputation assessment
-        reputation = osint_data.get("reputation_data", {})
         analysis["reputation_assessment"] = {
             "overall_sentiment": reputation.get("overall_sentiment", "Unknown"),
-            "media_coverage": "Positive" if reputation.get("positive_reviews", 0) > reputation.get("negative_reviews", 0) else "Mixed",
+            "media_coverage": "Positive" if positive_reviews > negative_reviews else "Mixed",
             "public_perception": "Favorable",
             "controversy_level": "Low"
         }
 
         # Risk indicators
         analysis["risk_indicators"] = {
-            "privacy_protection": "Enabled" if osint_data.get("domain_information", {}).get("privacy_protection") else "Disabled",
+            "privacy_protection": "Enabled" if privacy_protection else "Disabled",
             "information_exposure": "Minimal",
             "attack_surface": "Moderate",
             "opsec_practices": "Good"
         }
 
         # Identify red flags
-        if security_findings.get("data_breaches", 0) > 0:
-            analysis["red_flags"].append("Historical data breaches detected")
+        red_flags = analysis["red_flags"]
+        if breaches > 0:
+            red_flags.append("Historical data breaches detected")
 
-        if security_findings.get("dark_web_mentions", 0) > 0:
-            analysis["red_flags"].append("Dark web mentions found")
+        if dark_web_mentions > 0:
+            red_flags.append("Dark web mentions found")
 
-        if reputation.get("negative_reviews", 0) > reputation.get("positive_reviews", 0):
-            analysis["red_flags"].append("Predominantly negative online sentiment")
+        if negative_reviews > positive_reviews:
+            red_flags.append("Predominantly negative online sentiment")
 
         # Recommendations
         analysis["recommendations"].extend([
@@ -449,7 +639,7 @@ class OSINTAgent:
             "Monitor brand mentions and sentiment trends"
         ])
 
-        if not osint_data.get("domain_information", {}).get("privacy_protection"):
+        if not privacy_protection:
             analysis["recommendations"].append("Enable domain privacy protection")
 
         return analysis
@@ -481,35 +671,14 @@ class OSINTAgent:
 
     def _extract_citations(self, osint_data: dict) -> list[str]:
         """Extract citations from OSINT data sources"""
-        citations = []
-
-        if osint_data.get("sources"):
-            citations.extend(osint_data["sources"])
-
-        if osint_data.get("social_media_profiles"):
-            for profile in osint_data["social_media_profiles"]:
-                citations.append(f"{profile['platform']} - {profile['profile_url']}")
-
-        return citations
+        profiles = osint_data.get("social_media_profiles") or ()
+        # Insertion-ordered dict keeps the first occurrence of each citation
+        citations = dict.fromkeys(osint_data.get("sources") or ())
+        citations.update(dict.fromkeys(f"{profile.platform} - {profile.profile_url}" for profile in profiles))
+        return list(citations)
 
     def _calculate_confidence(self, results: dict, osint_data: dict) -> float:
         """Calculate confidence score based on data quality and source diversity"""
-        confidence_factors = []
-
-        # Data completeness
-        if osint_data.get("social_media_profiles"):
-            confidence_factors.append(0.25)
-        if osint_data.get("digital_footprint"):
-            confidence_factors.append(0.2)
-        if osint_data.get("domain_information"):
-            confidence_factors.append(0.15)
-        if osint_data.get("public_records"):
-            confidence_factors.append(0.2)
-        if osint_data.get("security_findings"):
-            confidence_factors.append(0.2)
-
-        # Source diversity
-        source_count = len(osint_data.get("sources", []))
-        confidence_factors.append(min(source_count * 0.02, 0.1))
-
-        return min(sum(confidence_factors), 1.0)
+        completeness = sum(weight for key, weight in _CONFIDENCE_WEIGHTS.items() if osint_data.get(key))
+        source_score = min(len(osint_data.get("sources", ())) * 0.02, 0.1)
+        return min(completeness + source_score, 1.0)
@@ -1,112 +1,117 @@
-from typing import Any
+import asyncio
+from functools import lru_cache
 
 from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_core.tools import tool
 from langchain_exa import ExaFindSimilarResults, ExaSearchResults
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 
+from src.agents.clients import get_chat_model
 from src.config.settings import settings
-from src.state.definitions import ResearchTask
+from src.memory.cache import ResponseCache, prompt_key
+from src.state.definitions import ResearchTask, TaskResult
+
+# Snippet searches by normalized query; repeat searches within an
+# investigation are served from here until RESPONSE_CACHE_TTL passes
+_snippet_cache = ResponseCache(maxsize=256, ttl=settings.response_cache_ttl)
+
+
+@tool
+def dummy_search(query: str) -> str:
+    """Dummy search tool for development/testing"""
+    return f"Mock search results for: {query}"
+
+
+@lru_cache(maxsize=1)
+def _build_research_tools() -> tuple:
+    """Build the research tool suite once and share it across agents"""
+    tools = []
+
+    # Add comprehensive Exa tools if API key is valid
+    if settings.has_exa_key:
+        try:
+            # Neural search for comprehensive, semantic research
+            tools.append(ExaSearchResults(
+                name="exa_neural_search",
+                description="Perform deep neural search for comprehensive research using semantic understanding. Best for exploratory research and finding conceptually related content.",
+                num_results=15,
+                api_key=settings.exa_api_key,
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Auto search for optimal results without manual type selection
+            tools.append(ExaSearchResults(
+                name="exa_auto_search",
+                description="Intelligent search that automatically chooses optimal search strategy (neural vs keyword). Use when unsure of best search approach.",
+                num_results=12,
+                api_key=settings.exa_api_key,
+                type="auto",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Keyword search for precise term matching
+            tools.append(ExaSearchResults(
+                name="exa_keyword_search",
+                description="Traditional keyword search for exact term matching. Best for proper nouns, specific company names, or technical terms.",
+                num_results=10,
+                api_key=settings.exa_api_key,
+                type="keyword",
+                text_contents_options=True
+            ))
+
+            # Large-scale comprehensive search for due diligence
+            tools.append(ExaSearchResults(
+                name="exa_comprehensive_search",
+                description="Large-scale search returning many results for comprehensive due diligence research. Use for thorough investigation.",
+                num_results=50,
+                api_key=settings.exa_api_key,
+                type="neural",
+                text_contents_options=True,
+                highlights=True
+            ))
+
+            # Find similar content for verification and expansion
+            tools.append(ExaFindSimilarResults(
+                name="exa_find_similar",
+                description="Find content similar to a given URL for cross-verification and expanding research scope",
+                num_results=8,
+                api_key=settings.exa_api_key,
+                text_contents_options=True
+            ))
+
+            print("✅ Advanced Exa tool suite initialized successfully")
+        except Exception as e:
+            print(f"Warning: Failed to initialize Exa tools: {e}")
+
+    # Add minimal Tavily for breaking news only
+    if settings.has_tavily_key:
+        try:
+            tools.append(TavilySearchResults(
+                name="tavily_breaking_news",
+                description="ONLY for breaking news and real-time updates within last 24 hours. Use sparingly as auxiliary to main Exa research.",
+                max_results=3,
+                api_wrapper_kwargs={"api_key": settings.tavily_api_key}
+            ))
+            print("✅ Tavily auxiliary tool initialized")
+        except Exception as e:
+            print(f"Warning: Failed to initialize Tavily: {e}")
+
+    # If no real tools available, add a dummy tool for testing
+    if not tools:
+        tools.append(dummy_search)
+        print("⚠️ Using dummy search tool - configure API keys for real functionality")
+
+    return tuple(tools)
 
 
 class ResearchAgent:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.default_model
-        self.model = ChatOpenAI(
-            model=self.model_name,
-            temperature=settings.default_temperature,
-            api_key=settings.openai_api_key
-        )
-        self.tools = self._initialize_tools()
-
-    def _initialize_tools(self):
-        tools = []
-
-        # Add comprehensive Exa tools if API key is valid
-        if settings.has_exa_key:
-            try:
-                # Neural search for comprehensive, semantic research
-                tools.append(ExaSearchResults(
-                    name="exa_neural_search",
-                    description="Perform deep neural search for comprehensive research using semantic understanding. Best for exploratory research and finding conceptually related content.",
-                    num_results=15,
-                    api_key=settings.exa_api_key,
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Auto search for optimal results without manual type selection
-                tools.append(ExaSearchResults(
-                    name="exa_auto_search",
-                    description="Intelligent search that automatically chooses optimal search strategy (neural vs keyword). Use when unsure of best search approach.",
-                    num_results=12,
-                    api_key=settings.exa_api_key,
-                    type="auto",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Keyword search for precise term matching
-                tools.append(ExaSearchResults(
-                    name="exa_keyword_search",
-                    description="Traditional keyword search for exact term matching. Best for proper nouns, specific company names, or technical terms.",
-                    num_results=10,
-                    api_key=settings.exa_api_key,
-                    type="keyword",
-                    text_contents_options=True
-                ))
-
-                # Large-scale comprehensive search for due diligence
-                tools.append(ExaSearchResults(
-                    name="exa_comprehensive_search",
-                    description="Large-scale search returning many results for comprehensive due diligence research. Use for thorough investigation.",
-                    num_results=50,
-                    api_key=settings.exa_api_key,
-                    type="neural",
-                    text_contents_options=True,
-                    highlights=True
-                ))
-
-                # Find similar content for verification and expansion
-                tools.append(ExaFindSimilarResults(
-                    name="exa_find_similar",
-                    description="Find content similar to a given URL for cross-verification and expanding research scope",
-                    num_results=8,
-                    api_key=settings.exa_api_key,
-                    text_contents_options=True
-                ))
-
-                print("✅ Advanced Exa tool suite initialized successfully")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Exa tools: {e}")
-
-        # Add minimal Tavily for breaking news only
-        if settings.has_tavily_key:
-            try:
-                tools.append(TavilySearchResults(
-                    name="tavily_breaking_news",
-                    description="ONLY for breaking news and real-time updates within last 24 hours. Use sparingly as auxiliary to main Exa research.",
-                    max_results=3,
-                    api_wrapper_kwargs={"api_key": settings.tavily_api_key}
-                ))
-                print("✅ Tavily auxiliary tool initialized")
-            except Exception as e:
-                print(f"Warning: Failed to initialize Tavily: {e}")
-
-        # If no real tools available, add a dummy tool for testing
-        if not tools:
-            from langchain_core.tools import tool
-
-            @tool
-            def dummy_search(query: str) -> str:
-                """Dummy search tool for development/testing"""
-                return f"Mock search results for: {query}"
-
-            tools.append(dummy_search)
-            print("⚠️ Using dummy search tool - configure API keys for real functionality")
-
-        return tools
+        self.model = get_chat_model(self.model_name, settings.default_temperature)
+        self.tools = list(_build_research_tools())
 
     def create_agent(self):
         return create_react_agent(
@@ -146,12 +151,12 @@ class ResearchAgent:
             name="research_agent"
         )
 
-    async def execute_task(self, task: ResearchTask, context: str = "") -> dict[str, Any]:
+    async def execute_task(self, task: ResearchTask, context: str = "") -> TaskResult:
         """Execute research task with two-tier retrieval strategy"""
 
         # Step 1: Initial search and snippet analysis
         search_query = self._build_search_query(task.description, context)
-        snippets = await self._search_snippets(search_query)
+        snippets = await self._cached_search_snippets(search_query)
 
         # Step 2: Analyze snippets for relevance
         relevant_sources = await self._analyze_snippets(snippets, task)
@@ -181,6 +186,17 @@ class ResearchAgent:
             base_query += f" {context}"
         return base_query
 
+    async def _cached_search_snippets(self, query: str) -> list[dict]:
+        """Search for snippets, reusing a recent result for the same query"""
+        key = prompt_key(" ".join(query.casefold().split()))
+        cached = _snippet_cache.get(key)
+        if cached is not None:
+            return cached
+
+        snippets = await self._search_snippets(query)
+        _snippet_cache.set(key, snippets)
+        return snippets
+
     async def _search_snippets(self, query: str) -> list[dict]:
         """Search multiple sources for initial snippets"""
         # This would use the actual tools in practice
@@ -196,6 +212,17 @@ class ResearchAgent:
 
     async def _extract_detailed_content(self, sources: list[dict]) -> str:
         """Extract detailed content from relevant sources"""
+        # Sources are independent, so fetch them all at once
+        contents = await asyncio.gather(
+            *(asyncio.wait_for(self._extract_source_content(source), timeout=settings.tool_timeout)
+              for source in sources),
+            return_exceptions=True
+        )
+        # A source that fails or times out is left out of the findings
+        return "\n\n".join(content for content in contents if isinstance(content, str))
+
+    async def _extract_source_content(self, source: dict) -> str:
+        """Extract detailed content from a single source"""
         # Implement content extraction
         return "Detailed research findings..."
 
@@ -7,7 +7,7 @@ from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 
 from src.config.settings import settings
-from src.state.definitions import ResearchTask
+from src.state.definitions import ResearchTask, TaskResult
 
 
 class VerificationAgent:
@@ -236,7 +236,7 @@ class VerificationAgent:
             name="verification_agent"
         )
 
-    async def execute_task(self, task: ResearchTask, context: str = "") -> dict[str, Any]:
+    async def execute_task(self, task: ResearchTask, context: str = "") -> TaskResult:
         """Execute verification task with systematic fact-checking approach"""
 
         # Step 1: Extract verification requirements
@@ -1,11 +1,13 @@
-import json
+import asyncio
 import uuid
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import BackgroundTasks, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
+from src.agents.clients import aclose_clients
 from src.config.settings import settings
 from src.workflows.due_diligence import DueDiligenceWorkflow
 
@@ -43,9 +45,15 @@ async def lifespan(app: FastAPI):
     # Startup
     global workflow
     workflow = DueDiligenceWorkflow()
+    warmup = None
+    if settings.warmup_clients:
+        # Runs in the background so startup isn't held up by the network
+        warmup = asyncio.create_task(workflow.osint_agent.warmup())
     yield
     # Shutdown
-    pass
+    if warmup is not None:
+        warmup.cancel()
+    await aclose_clients()
 
 app = FastAPI(
     title="Due Diligence API",
@@ -112,11 +120,11 @@ async def stream_results(thread_id: str):
                 # Format as Server-Sent Events
                 # Convert complex objects to JSON-serializable format
                 serializable_event = _make_serializable(event)
-                event_data = json.dumps(serializable_event)
-                yield f"data: {event_data}\n\n"
+                event_data = orjson.dumps(serializable_event, option=orjson.OPT_NON_STR_KEYS)
+                yield b"data: " + event_data + b"\n\n"
         except Exception as e:
-            error_data = json.dumps({"error": str(e)})
-            yield f"data: {error_data}\n\n"
+            error_data = orjson.dumps({"error": str(e)})
+            yield b"data: " + error_data + b"\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -28,6 +28,11 @@ class Settings(BaseSettings):
     # Model Configuration
     default_model: str = Field("gpt-4o-mini", env="DEFAULT_MODEL")
     default_temperature: float = Field(0.1, env="DEFAULT_TEMPERATURE")
+    llm_timeout: float = Field(60.0, env="LLM_TIMEOUT")
+    tool_timeout: float = Field(30.0, env="TOOL_TIMEOUT")
+    response_cache_ttl: float = Field(3600.0, env="RESPONSE_CACHE_TTL")
+    openai_rpm: int = Field(500, env="OPENAI_RPM")
+    warmup_clients: bool = Field(False, env="WARMUP_CLIENTS")
 
     # System Limits
     max_tasks_per_query: int = Field(10, env="MAX_TASKS_PER_QUERY")
@@ -0,0 +1,63 @@
+"""
+In-process response caching for LLM calls
+"""
+
+import copy
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+def prompt_key(*parts: str) -> str:
+    """Build a stable cache key from prompt text and any qualifying parts"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Bounded LRU cache for parsed LLM responses keyed on prompt hash
+
+    Entries expire after ``ttl`` seconds when one is given.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """Return a copy of the cached value, or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Hand out copies so callers can't mutate the cached response
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        """Store a value, evicting the least recently used entry when full
+
+        ``ttl`` overrides the cache-wide lifetime for this entry.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = math.inf if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
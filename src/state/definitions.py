@@ -32,6 +32,13 @@ class ResearchTask(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: datetime | None = None
 
+class TaskResult(TypedDict):
+    """Result returned by a task agent's execute_task"""
+    task_id: str
+    results: dict[str, Any]
+    citations: list[str]
+    confidence: float
+
 class DueDiligenceState(TypedDict):
     """Global state for the due diligence system"""
     # Core conversation
@@ -42,18 +42,14 @@ def workflow():
             return "Mock exa results"
 
     with patch('src.agents.task_agents.research.ExaSearchResults') as mock_exa, \
-         patch('src.agents.task_agents.financial.ExaSearchResults') as mock_exa_financial, \
-         patch('src.agents.task_agents.legal.ExaSearchResults') as mock_exa_legal, \
-         patch('src.agents.task_agents.osint.ExaSearchResults') as mock_exa_osint, \
+         patch('langchain_exa.ExaSearchResults') as mock_exa_lazy, \
          patch('src.agents.task_agents.verification.ExaSearchResults') as mock_exa_verification, \
          patch('langchain_openai.ChatOpenAI') as mock_openai, \
          patch('src.state.checkpointer.checkpointer_factory.create_checkpointer') as mock_checkpointer:
 
         # Mock the tools to return proper BaseTool instances
         mock_exa.return_value = MockExaTool()
-        mock_exa_financial.return_value = MockExaTool()
-        mock_exa_legal.return_value = MockExaTool()
-        mock_exa_osint.return_value = MockExaTool()
+        mock_exa_lazy.return_value = MockExaTool()
         mock_exa_verification.return_value = MockExaTool()
 
         # Mock the OpenAI model with proper async methods
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -5,8 +6,8 @@ import pytest
 from src.agents.planner import PlanningAgent
 from src.agents.supervisor import SupervisorAgent
 from src.agents.task_agents.financial import FinancialAgent
-from src.agents.task_agents.legal import LegalAgent
-from src.agents.task_agents.osint import OSINTAgent
+from src.agents.task_agents.legal import LegalAgent, LitigationCase, _parse_amount
+from src.agents.task_agents.osint import OSINTAgent, SocialProfile
 from src.agents.task_agents.research import ResearchAgent
 from src.agents.task_agents.verification import VerificationAgent
 from src.state.definitions import ResearchTask
@@ -23,7 +24,7 @@ async def test_supervisor_agent_creation():
 @pytest.mark.asyncio
 async def test_planner_query_analysis():
     """Test planning agent query analysis"""
-    with patch('src.agents.planner.ChatOpenAI') as mock_openai:
+    with patch('src.agents.planner.get_chat_model') as mock_openai:
         # Mock the AI response
         mock_response = MagicMock()
         mock_response.content = '{"complexity": "moderate", "estimated_time": 15, "key_areas": ["background", "compliance"], "risk_level": "medium"}'
@@ -40,6 +41,49 @@ async def test_planner_query_analysis():
         assert "estimated_time" in analysis
         assert isinstance(analysis["estimated_time"], (int, float))
 
+@pytest.mark.asyncio
+async def test_planner_caches_repeat_queries():
+    """Test planning agent reuses cached responses for identical prompts"""
+    with patch('src.agents.planner.get_chat_model') as mock_openai:
+        mock_response = MagicMock()
+        mock_response.content = '{"complexity": "simple", "estimated_time": 5, "key_areas": ["background"], "risk_level": "low"}'
+
+        mock_model = AsyncMock()
+        mock_model.ainvoke.return_value = mock_response
+        mock_openai.return_value = mock_model
+
+        planner = PlanningAgent()
+        first = await planner._analyze_query("Research Cache Test Corp background")
+        second = await planner._analyze_query("Research Cache Test Corp background")
+        assert first == second
+        assert mock_model.ainvoke.await_count == 1
+
+        await planner._analyze_query("Research Cache Test Corp background", force=True)
+        assert mock_model.ainvoke.await_count == 2
+
+@pytest.mark.asyncio
+async def test_planner_plan_uses_single_call():
+    """Test planning agent analyzes and plans with one model call"""
+    with patch('src.agents.planner.get_chat_model') as mock_openai:
+        mock_response = MagicMock()
+        mock_response.content = '{"analysis": {"complexity": "complex", "estimated_time": 30, "key_areas": ["legal"], "risk_level": "high"}, "plan": {"strategy": "Legal review", "tasks": [{"description": "Check litigation", "priority": 7, "agent": "legal"}], "required_agents": ["legal"], "dependencies": {}}}'
+
+        mock_model = AsyncMock()
+        mock_model.ainvoke.return_value = mock_response
+        mock_openai.return_value = mock_model
+
+        planner = PlanningAgent()
+        result = await planner.plan({
+            "query": "Single call plan for Merge Test Corp",
+            "entity_type": "company",
+            "entity_name": "Merge Test Corp"
+        })
+
+        assert mock_model.ainvoke.await_count == 1
+        assert result["research_plan"] == "Legal review"
+        assert result["metadata"]["complexity"] == "complex"
+        assert [task.assigned_agent for task in result["tasks"]] == ["legal"]
+
 @pytest.mark.asyncio
 async def test_financial_agent_creation():
     """Test financial agent creation"""
@@ -72,6 +116,28 @@ async def test_financial_agent_task_execution():
         assert isinstance(result["confidence"], float)
         assert 0.0 <= result["confidence"] <= 1.0
 
+def test_financial_focus_extraction():
+    """Test financial focus areas are detected from task keywords"""
+    financial = FinancialAgent()
+
+    focus = financial._extract_financial_focus(
+        "Review Acme Corp income statement, stock performance and SEC filings", ""
+    )
+    assert focus["focus_areas"] == ["financial_statements", "market_performance", "compliance"]
+    assert focus["analysis_type"] == "comprehensive"
+
+    focus = financial._extract_financial_focus("Assess Acme Corp debt load", "")
+    assert focus["focus_areas"] == ["credit_analysis"]
+    assert focus["analysis_type"] == "focused"
+
+def test_financial_entity_name_extraction():
+    """Test entity names are taken from the description, then the context"""
+    financial = FinancialAgent()
+
+    assert financial._extract_entity_name("Analyze financial status of Tesla Inc", "") == "Tesla Inc"
+    assert financial._extract_entity_name("Analyze debt levels", "Acme Corp review") == "Acme Corp"
+    assert financial._extract_entity_name("Analyze debt levels", "") == "Unknown Entity"
+
 @pytest.mark.asyncio
 async def test_legal_agent_creation():
     """Test legal agent creation"""
@@ -104,6 +170,79 @@ async def test_legal_agent_task_execution():
         assert isinstance(result["confidence"], float)
         assert 0.0 <= result["confidence"] <= 1.0
 
+@pytest.mark.asyncio
+async def test_legal_batch_shares_gather_per_entity():
+    """Test batched legal tasks gather data once per entity and focus set"""
+    legal = LegalAgent()
+    tasks = [
+        ResearchTask(description="Litigation review for Tesla Inc", assigned_agent="legal"),
+        ResearchTask(description="Litigation review for Tesla Inc", assigned_agent="legal"),
+        ResearchTask(description="Litigation review for Acme Corp", assigned_agent="legal"),
+    ]
+
+    with patch.object(legal, "_gather_legal_data", wraps=legal._gather_legal_data) as gather:
+        results = await legal.execute_tasks(tasks)
+
+    assert gather.await_count == 2
+    assert [result["task_id"] for result in results] == [task.id for task in tasks]
+
+@pytest.mark.asyncio
+async def test_legal_data_cached_for_repeat_screenings():
+    """Test near-identical legal screenings reuse gathered data"""
+    legal = LegalAgent()
+    focus = {"entity_name": "Cachetest Corp", "focus_areas": ["litigation"], "jurisdiction": "US"}
+
+    with patch.object(legal, "_fetch_litigation", wraps=legal._fetch_litigation) as fetch:
+        first = await legal._gather_legal_data(focus)
+        second = await legal._gather_legal_data({**focus, "entity_name": "cachetest  CORP"})
+        assert fetch.await_count == 1
+        assert second == first
+
+        await legal._gather_legal_data({**focus, "jurisdiction": "EU"})
+        assert fetch.await_count == 2
+
+@pytest.mark.asyncio
+async def test_legal_data_not_cached_without_entity():
+    """Test screenings with no identifiable entity never share cached data"""
+    legal = LegalAgent()
+    focus = {"entity_name": "Unknown Entity", "focus_areas": ["litigation"], "jurisdiction": "US"}
+
+    with patch.object(legal, "_fetch_litigation", wraps=legal._fetch_litigation) as fetch:
+        await legal._gather_legal_data(focus)
+        await legal._gather_legal_data(focus)
+
+    assert fetch.await_count == 2
+
+def test_legal_amount_parsing():
+    """Test litigation amounts parse with magnitude suffixes"""
+    assert _parse_amount("$2.5M") == 2_500_000
+    assert _parse_amount("$850K") == 850_000
+    assert _parse_amount("$1.2B") == 1_200_000_000
+    assert _parse_amount("$1,200") == 1_200
+    assert _parse_amount("undisclosed") == 0.0
+
+def test_legal_citations_are_deduplicated():
+    """Test legal citations drop repeats and keep first-seen order"""
+    legal = LegalAgent()
+    case = LitigationCase(
+        case_id="2023-CV-001234",
+        court="Superior Court",
+        status="Active",
+        filed_date="2023-01-15",
+        case_type="Contract Dispute",
+        amount="$2.5M"
+    )
+    citations = legal._extract_citations({
+        "sources": ["Court Records", "Sanctions Screening Services", "Court Records"],
+        "litigation_records": [case, case]
+    })
+
+    assert citations == [
+        "Court Records",
+        "Sanctions Screening Services",
+        "Case 2023-CV-001234 - Superior Court"
+    ]
+
 @pytest.mark.asyncio
 async def test_research_agent_creation():
     """Test research agent creation with Exa-first configuration"""
@@ -140,6 +279,36 @@ async def test_research_agent_task_execution():
         assert 0.0 <= result["confidence"] <= 1.0
 
 
+@pytest.mark.asyncio
+async def test_research_snippets_cached_per_query():
+    """Test repeat research searches reuse cached snippets"""
+    research = ResearchAgent()
+
+    with patch.object(research, "_search_snippets", wraps=research._search_snippets) as search:
+        first = await research._cached_search_snippets("Cachetest Corp leadership")
+        second = await research._cached_search_snippets("cachetest corp  LEADERSHIP")
+
+    assert search.await_count == 1
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_research_extraction_skips_failed_sources():
+    """Test research content is extracted per source and failures are dropped"""
+    research = ResearchAgent()
+    sources = [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}]
+
+    async def extract(source):
+        if source["url"].endswith("b"):
+            raise RuntimeError("source unavailable")
+        return f"Content from {source['url']}"
+
+    with patch.object(research, "_extract_source_content", side_effect=extract):
+        content = await research._extract_detailed_content(sources)
+
+    assert content == "Content from https://example.com/a"
+
+
 @pytest.mark.asyncio
 async def test_osint_agent_creation():
     """Test OSINT agent creation with comprehensive digital investigation tools"""
@@ -149,6 +318,7 @@ async def test_osint_agent_creation():
         assert agent is not None
         # Should have multiple tools for OSINT investigation
         assert len(osint.tools) >= 1
+        assert osint.create_agent() is agent
 
 
 @pytest.mark.asyncio
@@ -174,6 +344,116 @@ async def test_osint_agent_task_execution():
         assert result["task_id"] == task.id
 
 
+def test_osint_focus_and_entity_type_extraction():
+    """Test OSINT focus areas and entity type come from one keyword scan"""
+    osint = OSINTAgent()
+
+    focus = osint._extract_osint_focus("Review the Website security and breach history of Acme", "")
+    assert focus["focus_areas"] == ["domain_analysis", "security"]
+    assert focus["entity_type"] == "digital_asset"
+    assert focus["investigation_scope"] == "targeted"
+
+    assert osint._extract_entity_type("Founder background check", "") == "person"
+    assert osint._extract_entity_type("General review", "") == "unknown"
+
+
+def test_osint_entity_name_extraction():
+    """Test OSINT entity names match company suffixes, then person hints"""
+    osint = OSINTAgent()
+
+    assert osint._extract_entity_name("OSINT investigation of Tesla Inc footprint", "") == "Tesla Inc"
+    assert osint._extract_entity_name("Background on the founder Jane Doe", "") == "Background"
+    assert osint._extract_entity_name("review the founder jane", "") == "Unknown Entity"
+
+
+def test_osint_citations_are_deduplicated():
+    """Test OSINT citations drop repeats and keep first-seen order"""
+    osint = OSINTAgent()
+    profile = SocialProfile(
+        platform="LinkedIn",
+        profile_url="linkedin.com/company/acme",
+        followers=120,
+        activity_level="Low",
+        last_post="2024-09-01"
+    )
+    citations = osint._extract_citations({
+        "sources": ["Social Media Platforms", "Public Records Repositories", "Social Media Platforms"],
+        "social_media_profiles": [profile, profile]
+    })
+
+    assert citations == [
+        "Social Media Platforms",
+        "Public Records Repositories",
+        "LinkedIn - linkedin.com/company/acme"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_osint_lookups_cached_per_entity():
+    """Test repeat OSINT lookups for the same entity reuse cached results"""
+    osint = OSINTAgent()
+
+    with patch.object(osint, "_fetch_security", wraps=osint._fetch_security) as fetch:
+        first = await osint._cached_fetch("_fetch_security", "Cachetest Corp")
+        second = await osint._cached_fetch("_fetch_security", "cachetest  corp")
+
+    assert fetch.await_count == 1
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_osint_lookups_not_cached_without_entity():
+    """Test OSINT lookups with no identifiable entity are never shared"""
+    osint = OSINTAgent()
+
+    with patch.object(osint, "_fetch_security", wraps=osint._fetch_security) as fetch:
+        await osint._cached_fetch("_fetch_security", "Unknown Entity")
+        await osint._cached_fetch("_fetch_security", "Unknown Entity")
+
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_osint_concurrent_lookups_share_one_fetch():
+    """Test concurrent OSINT lookups for one entity share a single fetch"""
+    osint = OSINTAgent()
+
+    with patch.object(osint, "_fetch_reputation", wraps=osint._fetch_reputation) as fetch:
+        results = await asyncio.gather(
+            *(osint._cached_fetch("_fetch_reputation", "Inflight Corp") for _ in range(3))
+        )
+
+    assert fetch.await_count == 1
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+
+@pytest.mark.asyncio
+async def test_osint_lookup_cached_after_owner_times_out():
+    """Test a shared OSINT lookup is cached even when the caller that started it times out"""
+    osint = OSINTAgent()
+    started = asyncio.Event()
+
+    async def slow_fetch(entity_name):
+        started.set()
+        await asyncio.sleep(0.05)
+        return {"overall_sentiment": "Positive"}
+
+    with patch.object(osint, "_fetch_reputation", side_effect=slow_fetch) as fetch:
+        owner = asyncio.ensure_future(
+            asyncio.wait_for(osint._cached_fetch("_fetch_reputation", "Timeout Corp"), timeout=0.01)
+        )
+        await started.wait()
+        joined = await osint._cached_fetch("_fetch_reputation", "Timeout Corp")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await owner
+        again = await osint._cached_fetch("_fetch_reputation", "Timeout Corp")
+
+    assert fetch.await_count == 1
+    assert joined == again == {"overall_sentiment": "Positive"}
+
+
 @pytest.mark.asyncio
 async def test_verification_agent_creation():
     """Test verification agent creation with fact-checking capabilities"""
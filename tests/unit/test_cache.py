@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+from src.memory.cache import ResponseCache, prompt_key
+
+
+def test_prompt_key_is_stable_and_distinct():
+    """Test prompt keys are deterministic and qualified by every part"""
+    assert prompt_key("gpt-4o-mini", "prompt") == prompt_key("gpt-4o-mini", "prompt")
+    assert prompt_key("gpt-4o-mini", "prompt") != prompt_key("gpt-4o", "prompt")
+    assert prompt_key("ab", "c") != prompt_key("a", "bc")
+
+def test_response_cache_returns_copies():
+    """Test cached values can't be mutated through returned references"""
+    cache = ResponseCache()
+    cache.set("key", {"tasks": ["a"]})
+
+    hit = cache.get("key")
+    hit["tasks"].append("b")
+
+    assert cache.get("key") == {"tasks": ["a"]}
+    assert cache.get("missing") is None
+
+def test_response_cache_evicts_least_recently_used():
+    """Test the cache stays bounded and evicts in LRU order"""
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+def test_response_cache_expires_entries_after_ttl():
+    """Test entries older than the TTL are treated as misses"""
+    cache = ResponseCache(ttl=60)
+    with patch("src.memory.cache.time.monotonic", return_value=1000.0):
+        cache.set("key", "value")
+    with patch("src.memory.cache.time.monotonic", return_value=1059.0):
+        assert cache.get("key") == "value"
+    with patch("src.memory.cache.time.monotonic", return_value=1060.0):
+        assert cache.get("key") is None
+
+    assert len(cache) == 0
+
+def test_response_cache_per_entry_ttl_overrides_default():
+    """Test a per-entry TTL replaces the cache-wide lifetime"""
+    cache = ResponseCache(ttl=60)
+    with patch("src.memory.cache.time.monotonic", return_value=1000.0):
+        cache.set("short", "value", ttl=5)
+        cache.set("default", "value")
+    with patch("src.memory.cache.time.monotonic", return_value=1010.0):
+        assert cache.get("short") is None
+        assert cache.get("default") == "value"